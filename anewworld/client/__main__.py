@@ -4,51 +4,77 @@ Client-side logic for anewworld.
 
 from __future__ import annotations
 
-import asyncio
-import sys
-
 import pygame
 
-from anewworld.client.config import ClientConfig, DevConfig, WindowConfig
+from anewworld.client.config import DEBUG, ClientConfig, WindowConfig
 from anewworld.client.controls import Controls
 from anewworld.client.net.client import ServerConnection
 from anewworld.client.net.client_state import ClientState
 from anewworld.client.renderer.camera import Camera
+from anewworld.client.renderer.chunk_prefetcher import ChunkPrefetcher
 from anewworld.client.renderer.chunk_renderer import ChunkRenderer
 from anewworld.client.renderer.terrain_palette import TerrainPalette
 from anewworld.shared.config import WorldConfig
 from anewworld.shared.terrain_generator import TerrainGenerator
 from anewworld.shared.world_map import WorldMap
 
+_REPAINT_EVENTS = (
+    pygame.WINDOWEXPOSED,
+    pygame.VIDEOEXPOSE,
+    pygame.WINDOWRESTORED,
+    pygame.WINDOWSIZECHANGED,
+)
+"""
+Window events after which the whole frame must be presented again, even if
+nothing was redrawn.
+"""
+
+_EVENT_MASK = (
+    pygame.QUIT,
+    pygame.KEYDOWN,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEBUTTONUP,
+    *_REPAINT_EVENTS,
+)
+"""
+Event types the main loop consumes; SDL drops everything else before it is
+queued. Mouse motion is left out because drags poll the mouse directly.
+"""
+
 
 def main() -> None:
     """
     Start anewworld client.
     """
-    pygame.init()
+    # Only video (which brings events) is used; skip audio, joystick, etc.
+    pygame.display.init()
+
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(_EVENT_MASK)
 
     world_cfg = WorldConfig()
     window_cfg = WindowConfig()
     client_cfg = ClientConfig()
-    dev_cfg = DevConfig()
 
     conn: ServerConnection | None = None
     state: ClientState | None = None
+    renderer: ChunkRenderer | None = None
+    prefetcher: ChunkPrefetcher | None = None
 
     if not client_cfg.singleplayer:
-        conn, state = asyncio.run(
-            ServerConnection.connect(
-                host="127.0.0.1",
-                port=7777,
-            )
+        conn, state = ServerConnection.connect(
+            host="127.0.0.1",
+            port=7777,
         )
-        if dev_cfg.debug:
+        if __debug__ and DEBUG:
             print(f"Connected as {conn.player_id}")
             print(f"Inventory: {state.inventory.to_wire()}")
 
     try:
         screen = pygame.display.set_mode(
-            (window_cfg.screen_width, window_cfg.screen_height)
+            (window_cfg.screen_width, window_cfg.screen_height),
+            pygame.SCALED | pygame.DOUBLEBUF,
+            vsync=1,
         )
         pygame.display.set_caption("A New World")
 
@@ -74,31 +100,76 @@ def main() -> None:
         camera = Camera()
         controls = Controls(camera=camera, pan_button=1)
 
+        renderer.prewarm(screen=screen, world_map=world_map, camera=camera)
+
+        prefetcher = ChunkPrefetcher.new(
+            tile_size=window_cfg.tile_size,
+            chunk_size=world_cfg.chunk_size,
+            padding_chunks=3,
+            camera=camera,
+        )
+
+        fps = window_cfg.fps
+        screen_w = window_cfg.screen_width
+        screen_h = window_cfg.screen_height
+        screen_area = screen_w * screen_h
+
         running = True
         while running:
-            clock.tick(window_cfg.fps)
+            clock.tick(fps)
+
+            if conn is not None and state is not None:
+                for msg in conn.tick():
+                    state.apply(msg)
+
+            repaint = False
 
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-                    continue
+            # peek pumps SDL, so most frames end here without building a list.
+            if pygame.event.peek():
+                for event in pygame.event.get(pump=False):
+                    if event.type in _REPAINT_EVENTS:
+                        repaint = True
+                        continue
 
-                if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
-                    running = False
-                    continue
+                    if event.type == pygame.QUIT:
+                        running = False
+                        continue
 
-                controls.handle_event(event)
+                    if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
+                        running = False
+                        continue
 
-            screen.fill((0, 0, 0))
-            renderer.draw(screen=screen, world_map=world_map, camera=camera)
-            pygame.display.flip()
+                    controls.handle_event(event)
+
+            controls.update()
+
+            prefetcher.tick(
+                world_map=world_map,
+                camera=camera,
+                screen_w=screen_w,
+                screen_h=screen_h,
+            )
+
+            dirty = renderer.draw(screen=screen, world_map=world_map, camera=camera)
+            if repaint:
+                pygame.display.flip()
+            elif dirty:
+                if sum(r.w * r.h for r in dirty) < screen_area // 4:
+                    pygame.display.update(dirty)
+                else:
+                    pygame.display.flip()
 
     finally:
+        if prefetcher is not None:
+            prefetcher.close()
+
+        if renderer is not None:
+            renderer.close()
+
         if conn is not None:
-            asyncio.run(conn.close())
+            conn.close()
 
         pygame.quit()
-        sys.exit()
 
 
 if __name__ == "__main__":
@@ -54,3 +54,12 @@ class DevConfig:
     """
     Debug mode.
     """
+
+
+DEBUG: bool = DevConfig().debug
+"""
+Module-level copy of `DevConfig.debug`.
+
+Guard debug-only code with `if __debug__ and DEBUG:` so that running the
+client with `python -O` compiles it out entirely.
+"""
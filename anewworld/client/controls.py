@@ -2,6 +2,9 @@
 Input handling and control routing.
 """
 
+from __future__ import annotations
+
+from collections.abc import Callable
 from dataclasses import dataclass
 
 import pygame
@@ -37,16 +40,59 @@ class Controls:
         event: pygame.event.Event
             Event to process.
         """
-        if event.type == pygame.MOUSEBUTTONDOWN and event.button == self.pan_button:
+        handler = _HANDLERS.get(event.type)
+        if handler is not None:
+            handler(self, event)
+
+    def _on_button_down(self, event: pygame.event.Event) -> None:
+        """
+        Start a camera drag when the pan button is pressed.
+
+        Parameters
+        ----------
+        event: pygame.event.Event
+            `MOUSEBUTTONDOWN` event.
+        """
+        if event.button == self.pan_button:
             mx, my = event.pos
             self.camera.begin_drag(mouse_x=mx, mouse_y=my)
-            return
 
-        if event.type == pygame.MOUSEBUTTONUP and event.button == self.pan_button:
+    def _on_button_up(self, event: pygame.event.Event) -> None:
+        """
+        End a camera drag when the pan button is released.
+
+        Parameters
+        ----------
+        event: pygame.event.Event
+            `MOUSEBUTTONUP` event.
+        """
+        if event.button == self.pan_button:
             self.camera.end_drag()
+
+    def update(self) -> None:
+        """
+        Apply continuous input once per tick.
+
+        Mouse motion events are blocked, so drags follow the polled cursor
+        position instead. A drag also ends if the pan button is no longer
+        held, e.g. when it was released outside the window.
+        """
+        camera = self.camera
+        if not camera.dragging:
             return
 
-        if event.type == pygame.MOUSEMOTION:
-            mx, my = event.pos
-            self.camera.drag_to(mouse_x=mx, mouse_y=my)
+        if not pygame.mouse.get_pressed(num_buttons=5)[self.pan_button - 1]:
+            camera.end_drag()
             return
+
+        mx, my = pygame.mouse.get_pos()
+        camera.drag_to(mouse_x=mx, mouse_y=my)
+
+
+_HANDLERS: dict[int, Callable[[Controls, pygame.event.Event], None]] = {
+    pygame.MOUSEBUTTONDOWN: Controls._on_button_down,
+    pygame.MOUSEBUTTONUP: Controls._on_button_up,
+}
+"""
+Event type to Controls handler dispatch table.
+"""
@@ -4,18 +4,37 @@ Client networking utilities.
 
 from __future__ import annotations
 
-import asyncio
-import json
-from dataclasses import dataclass
+import socket
+from dataclasses import dataclass, field
 from typing import Any
 
+import msgpack
+
 from anewworld.client.net.client_state import ClientState
 from anewworld.shared.inventory import Inventory
 
+_HEADER_SIZE = 4
+"""
+Size of the big-endian length prefix preceding every frame, in bytes.
+"""
+
+_RECV_SIZE = 65536
+"""
+Maximum number of bytes requested from the socket per recv call.
+"""
+
+_RECV_BUDGET = 4 * _RECV_SIZE
+"""
+Maximum number of bytes read from the socket per tick.
+
+Anything beyond this is left in the kernel buffer for the next frame so a
+burst of traffic cannot stall rendering.
+"""
+
 
 def _dumps(obj: dict[str, Any]) -> bytes:
     """
-    Encode a message as newline-delimited JSON bytes.
+    Encode a message as a length-prefixed MessagePack frame.
 
     Parameters
     ----------
@@ -25,15 +44,46 @@ def _dumps(obj: dict[str, Any]) -> bytes:
     Returns
     -------
     bytes
-        UTF-8 encoded JSON message terminated by a newline.
+        Big-endian payload length followed by the MessagePack payload.
     """
-    return (json.dumps(obj, separators=(",", ":")) + "\n").encode("utf-8")
+    payload: bytes = msgpack.packb(obj, use_bin_type=True)
+    return len(payload).to_bytes(_HEADER_SIZE, "big") + payload
+
+
+def _pop_frame(buf: bytearray) -> bytes | None:
+    """
+    Remove and return the first complete frame payload in a buffer.
+
+    Parameters
+    ----------
+    buf : bytearray
+        Receive buffer holding raw bytes read from the socket.
+
+    Returns
+    -------
+    bytes | None
+        Frame payload, or None if the buffer does not hold a full frame.
+    """
+    if len(buf) < _HEADER_SIZE:
+        return None
+
+    end = _HEADER_SIZE + int.from_bytes(buf[:_HEADER_SIZE], "big")
+    if len(buf) < end:
+        return None
+
+    payload = bytes(buf[_HEADER_SIZE:end])
+    del buf[:end]
+    return payload
 
 
 @dataclass(slots=True)
 class ServerConnection:
     """
     Connected client-side session to server.
+
+    The handshake in `connect` is blocking. Afterwards the socket is
+    non-blocking and all traffic is pumped by `tick`, which is meant to be
+    called once per frame from the render loop.
     """
 
     host: str
@@ -46,23 +96,43 @@ class ServerConnection:
     Server port.
     """
 
-    reader: asyncio.StreamReader
+    sock: socket.socket
     """
-    Stream reader associated with the server connection.
+    Non-blocking socket connected to the server.
     """
 
-    writer: asyncio.StreamWriter
+    player_id: int
     """
-    Stream writer associated with the server connection.
+    Assigned player id for this connection.
     """
 
-    player_id: int
+    _rxbuf: bytearray = field(default_factory=bytearray)
     """
-    Assigned player id for this connection.
+    Bytes received from the server that do not yet form a full frame.
+    """
+
+    _txbuf: bytearray = field(default_factory=bytearray)
+    """
+    Encoded frames waiting to be written to the socket.
+    """
+
+    _recv_view: memoryview = field(
+        default_factory=lambda: memoryview(bytearray(_RECV_SIZE))
+    )
+    """
+    Reused scratch buffer the socket reads into before bytes are appended
+    to `_rxbuf`.
+    """
+
+    _packer: msgpack.Packer = field(
+        default_factory=lambda: msgpack.Packer(use_bin_type=True)
+    )
+    """
+    Reused MessagePack encoder for outgoing messages.
     """
 
     @classmethod
-    async def connect(
+    def connect(
         cls,
         *,
         host: str,
@@ -88,47 +158,50 @@ class ServerConnection:
         RuntimeError
             If the server returns an unexpected response.
         """
-        reader, writer = await asyncio.open_connection(host, port)
+        sock = socket.create_connection((host, port))
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.sendall(_dumps({"t": "request_id"}))
 
-        writer.write(_dumps({"t": "request_id"}))
-        await writer.drain()
+        rxbuf = bytearray()
 
         # --- Expect assign_id ---
-        line = await reader.readline()
-        if not line:
-            writer.close()
-            await writer.wait_closed()
+        payload = cls._read_frame_blocking(sock, rxbuf)
+        if payload is None:
+            sock.close()
             raise RuntimeError("Server closed connection during handshake.")
 
-        msg = cls._parse(line)
+        msg = cls._parse(payload)
         if msg is None or msg.get("t") != "assign_id" or "player_id" not in msg:
-            writer.close()
-            await writer.wait_closed()
-            raise RuntimeError(f"Unexpected handshake response (assign_id): {line!r}")
+            sock.close()
+            raise RuntimeError(
+                f"Unexpected handshake response (assign_id): {payload!r}"
+            )
 
         player_id = int(msg["player_id"])
 
         # --- Expect inventory snapshot ---
-        line = await reader.readline()
-        if not line:
-            writer.close()
-            await writer.wait_closed()
+        payload = cls._read_frame_blocking(sock, rxbuf)
+        if payload is None:
+            sock.close()
             raise RuntimeError("Server closed connection during inventory bootstrap.")
 
-        msg = cls._parse(line)
+        msg = cls._parse(payload)
         if msg is None or msg.get("t") != "inventory" or "items" not in msg:
-            writer.close()
-            await writer.wait_closed()
-            raise RuntimeError(f"Unexpected handshake response (inventory): {line!r}")
+            sock.close()
+            raise RuntimeError(
+                f"Unexpected handshake response (inventory): {payload!r}"
+            )
 
         inventory = Inventory.from_wire(msg.get("items", {}))
 
+        sock.setblocking(False)
+
         conn = cls(
             host=host,
             port=port,
-            reader=reader,
-            writer=writer,
+            sock=sock,
             player_id=player_id,
+            _rxbuf=rxbuf,
         )
 
         state = ClientState(
@@ -138,12 +211,14 @@ class ServerConnection:
 
         return conn, state
 
-    async def send(
+    def send(
         self,
         msg: dict[str, Any],
     ) -> None:
         """
-        Send a single message to the server.
+        Queue a single message for the server.
+
+        The message is written on the next `tick`.
 
         Parameters
         ----------
@@ -154,34 +229,49 @@ class ServerConnection:
         -------
         None
         """
-        self.writer.write(_dumps(msg))
-        await self.writer.drain()
+        self._queue_frame(msg)
 
-    async def recv(self) -> dict[str, Any]:
+    def send_many(
+        self,
+        msgs: list[dict[str, Any]],
+    ) -> None:
         """
-        Receive a single message from the server.
+        Queue several messages for the server.
+
+        All queued messages are written together on the next `tick`.
+
+        Parameters
+        ----------
+        msgs : list[dict[str, Any]]
+            Messages to send, in order.
 
         Returns
         -------
-        dict[str, Any]
-            Decoded message.
+        None
+        """
+        for msg in msgs:
+            self._queue_frame(msg)
+
+    def tick(self) -> list[dict[str, Any]]:
+        """
+        Flush queued messages and collect received ones without blocking.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            Messages received since the previous tick, in arrival order.
 
         Raises
         ------
         RuntimeError
-            If the server closes the connection or sends invalid JSON.
+            If the server closes the connection or sends an invalid message.
         """
-        line = await self.reader.readline()
-        if not line:
-            raise RuntimeError("Server closed connection.")
-
-        msg = self._parse(line)
-        if msg is None:
-            raise RuntimeError(f"Bad JSON from server: {line!r}")
+        self._flush()
+        self._fill_rxbuf()
 
-        return msg
+        return self._drain_rxbuf()
 
-    async def close(self) -> None:
+    def close(self) -> None:
         """
         Close the connection to the server.
 
@@ -189,18 +279,155 @@ class ServerConnection:
         -------
         None
         """
-        self.writer.close()
-        await self.writer.wait_closed()
+        self.sock.close()
+
+    def _queue_frame(self, msg: dict[str, Any]) -> None:
+        """
+        Encode a message and append it, framed, to the outbound buffer.
+
+        The header and payload are appended separately so no intermediate
+        frame object is built.
+
+        Parameters
+        ----------
+        msg : dict[str, Any]
+            Message to encode.
+
+        Returns
+        -------
+        None
+        """
+        payload = self._packer.pack(msg)
+        txbuf = self._txbuf
+        txbuf += len(payload).to_bytes(_HEADER_SIZE, "big")
+        txbuf += payload
+
+    def _flush(self) -> None:
+        """
+        Write as much of the outbound buffer as the socket accepts.
+
+        Returns
+        -------
+        None
+        """
+        if not self._txbuf:
+            return
+
+        try:
+            sent = self.sock.send(self._txbuf)
+        except BlockingIOError:
+            return
+
+        del self._txbuf[:sent]
+
+    def _fill_rxbuf(self) -> None:
+        """
+        Read what is available on the socket, up to the per-tick budget.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        RuntimeError
+            If the server closed the connection.
+        """
+        recv_into = self.sock.recv_into
+        view = self._recv_view
+        budget = _RECV_BUDGET
+        while budget > 0:
+            try:
+                n = recv_into(view)
+            except BlockingIOError:
+                return
+
+            if not n:
+                raise RuntimeError("Server closed connection.")
+
+            self._rxbuf += view[:n]
+            budget -= n
+
+    def _drain_rxbuf(self) -> list[dict[str, Any]]:
+        """
+        Decode and remove every complete frame in the receive buffer.
+
+        Payloads are decoded straight from a view of the buffer, without
+        copying each frame out first. Any trailing partial frame is kept.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            Decoded messages, in arrival order.
+
+        Raises
+        ------
+        RuntimeError
+            If a frame does not hold a valid message.
+        """
+        buf = self._rxbuf
+        n = len(buf)
+        off = 0
+        msgs: list[dict[str, Any]] = []
+
+        with memoryview(buf) as view:
+            while n - off >= _HEADER_SIZE:
+                start = off + _HEADER_SIZE
+                end = start + int.from_bytes(view[off:start], "big")
+                if end > n:
+                    break
+
+                msg = self._parse(view[start:end])
+                if msg is None:
+                    payload = bytes(view[start:end])
+                    raise RuntimeError(f"Bad message from server: {payload!r}")
+
+                msgs.append(msg)
+                off = end
+
+        if off:
+            del buf[:off]
+        return msgs
+
+    @staticmethod
+    def _read_frame_blocking(
+        sock: socket.socket,
+        rxbuf: bytearray,
+    ) -> bytes | None:
+        """
+        Read the next frame payload from a blocking socket.
+
+        Bytes received past the end of the frame stay in `rxbuf`.
+
+        Parameters
+        ----------
+        sock : socket.socket
+            Blocking socket connected to the server.
+        rxbuf : bytearray
+            Receive buffer holding bytes not yet consumed as frames.
+
+        Returns
+        -------
+        bytes | None
+            Frame payload, or None if the server closed the connection.
+        """
+        while (payload := _pop_frame(rxbuf)) is None:
+            data = sock.recv(_RECV_SIZE)
+            if not data:
+                return None
+            rxbuf += data
+
+        return payload
 
     @staticmethod
-    def _parse(line: bytes) -> dict[str, Any] | None:
+    def _parse(payload: bytes | memoryview) -> dict[str, Any] | None:
         """
-        Parse a single JSON line.
+        Parse a single MessagePack frame payload.
 
         Parameters
         ----------
-        line : bytes
-            Raw message bytes.
+        payload : bytes | memoryview
+            Raw frame payload, without the length prefix.
 
         Returns
         -------
@@ -208,8 +435,8 @@ class ServerConnection:
             Parsed dict if valid, otherwise None.
         """
         try:
-            obj = json.loads(line.decode("utf-8"))
-        except json.JSONDecodeError:
+            obj = msgpack.unpackb(payload, raw=False)
+        except ValueError:
             return None
 
         if not isinstance(obj, dict):
@@ -4,7 +4,9 @@ Client-side game state.
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass
+from typing import Any
 
 from anewworld.shared.inventory import Inventory
 
@@ -24,3 +26,49 @@ class ClientState:
     """
     Latest inventory snapshot received from server.
     """
+
+    def apply(self, msg: dict[str, Any]) -> None:
+        """
+        Apply a server message to the local state.
+
+        Messages that do not affect client state are ignored.
+
+        Parameters
+        ----------
+        msg : dict[str, Any]
+            Decoded server message.
+
+        Returns
+        -------
+        None
+        """
+        msg_type = msg.get("t")
+        if not isinstance(msg_type, str):
+            return
+
+        handler = _HANDLERS.get(msg_type)
+        if handler is not None:
+            handler(self, msg)
+
+    def _apply_inventory(self, msg: dict[str, Any]) -> None:
+        """
+        Replace the local inventory with a server snapshot.
+
+        Parameters
+        ----------
+        msg : dict[str, Any]
+            Decoded `inventory` message.
+
+        Returns
+        -------
+        None
+        """
+        self.inventory = Inventory.from_wire(msg.get("items", {}))
+
+
+_HANDLERS: dict[str, Callable[[ClientState, dict[str, Any]], None]] = {
+    "inventory": ClientState._apply_inventory,
+}
+"""
+Message type to ClientState handler dispatch table.
+"""
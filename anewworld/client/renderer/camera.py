@@ -26,24 +26,18 @@ class Camera:
     Whether the user is currently dragging the camera.
     """
 
-    _drag_start_mouse_x: int = 0
-    """
-    Mouse X position at the start of a drag, in screen pixels.
+    _drag_anchor_x: int = 0
     """
+    Camera X at the start of a drag plus the mouse X at that time.
 
-    _drag_start_mouse_y: int = 0
-    """
-    Mouse Y position at the start of a drag, in screen pixels.
+    Subtracting the current mouse X yields the dragged camera X.
     """
 
-    _drag_start_cam_x: int = 0
-    """
-    Camera X position at the start of a drag, in world pixels.
+    _drag_anchor_y: int = 0
     """
+    Camera Y at the start of a drag plus the mouse Y at that time.
 
-    _drag_start_cam_y: int = 0
-    """
-    Camera Y position at the start of a drag, in world pixels.
+    Subtracting the current mouse Y yields the dragged camera Y.
     """
 
     def begin_drag(self, *, mouse_x: int, mouse_y: int) -> None:
@@ -58,10 +52,8 @@ class Camera:
             Mouse Y position in screen pixels.
         """
         self.dragging = True
-        self._drag_start_mouse_x = mouse_x
-        self._drag_start_mouse_y = mouse_y
-        self._drag_start_cam_x = self.x_px
-        self._drag_start_cam_y = self.y_px
+        self._drag_anchor_x = self.x_px + mouse_x
+        self._drag_anchor_y = self.y_px + mouse_y
 
     def end_drag(self) -> None:
         """
@@ -83,11 +75,8 @@ class Camera:
         if not self.dragging:
             return
 
-        dx = mouse_x - self._drag_start_mouse_x
-        dy = mouse_y - self._drag_start_mouse_y
-
-        self.x_px = self._drag_start_cam_x - dx
-        self.y_px = self._drag_start_cam_y - dy
+        self.x_px = self._drag_anchor_x - mouse_x
+        self.y_px = self._drag_anchor_y - mouse_y
 
     def viewport_px(
         self,
@@ -0,0 +1,161 @@
+"""
+Background chunk generation ahead of camera motion.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from anewworld.shared.world_map import WorldMap
+
+from .camera import Camera
+
+
+@dataclass(slots=True)
+class ChunkPrefetcher:
+    """
+    Generate chunks just outside the rendered area on worker threads.
+
+    Each tick the camera velocity is extrapolated a few ticks ahead and the
+    ring of chunks beyond the renderer's padding around that predicted view
+    is submitted for generation.
+    """
+
+    chunk_px: int
+    """
+    Width and height of a chunk in pixels.
+    """
+
+    padding_chunks: int
+    """
+    Padding used by the renderer; prefetching starts one chunk past it.
+    """
+
+    ring_chunks: int
+    """
+    Width of the prefetched ring, in chunks.
+    """
+
+    lookahead_ticks: int
+    """
+    Number of ticks the camera velocity is extrapolated.
+    """
+
+    executor: ThreadPoolExecutor
+    """
+    Worker pool running chunk generation.
+    """
+
+    _last_x: int
+    """
+    Camera X position on the previous tick, in world pixels.
+    """
+
+    _last_y: int
+    """
+    Camera Y position on the previous tick, in world pixels.
+    """
+
+    @classmethod
+    def new(
+        cls,
+        *,
+        tile_size: int,
+        chunk_size: int,
+        padding_chunks: int,
+        camera: Camera,
+        ring_chunks: int = 2,
+        lookahead_ticks: int = 30,
+        max_workers: int = 2,
+    ) -> ChunkPrefetcher:
+        """
+        Construct a new chunk prefetcher.
+
+        Parameters
+        ----------
+        tile_size : int
+            Size of a tile in pixels.
+        chunk_size : int
+            Width and height of a chunk in tiles.
+        padding_chunks : int
+            Padding used by the renderer beyond the viewport.
+        camera : Camera
+            Camera whose motion drives prefetching.
+        ring_chunks : int
+            Width of the prefetched ring, in chunks.
+        lookahead_ticks : int
+            Number of ticks the camera velocity is extrapolated.
+        max_workers : int
+            Number of generation worker threads.
+
+        Returns
+        -------
+        ChunkPrefetcher
+            A newly constructed prefetcher.
+        """
+        return cls(
+            chunk_px=chunk_size * tile_size,
+            padding_chunks=padding_chunks,
+            ring_chunks=ring_chunks,
+            lookahead_ticks=lookahead_ticks,
+            executor=ThreadPoolExecutor(max_workers=max_workers),
+            _last_x=camera.x_px,
+            _last_y=camera.y_px,
+        )
+
+    def tick(
+        self,
+        *,
+        world_map: WorldMap,
+        camera: Camera,
+        screen_w: int,
+        screen_h: int,
+    ) -> None:
+        """
+        Collect finished chunks and submit the predicted ring.
+
+        Parameters
+        ----------
+        world_map : WorldMap
+            World map to prefetch into.
+        camera : Camera
+            Camera describing visible region in world px.
+        screen_w : int
+            Screen width in pixels.
+        screen_h : int
+            Screen height in pixels.
+        """
+        world_map.collect_prefetched()
+
+        dx = camera.x_px - self._last_x
+        dy = camera.y_px - self._last_y
+        self._last_x = camera.x_px
+        self._last_y = camera.y_px
+
+        left = camera.x_px + dx * self.lookahead_ticks
+        top = camera.y_px + dy * self.lookahead_ticks
+
+        chunk_px = self.chunk_px
+        inner = self.padding_chunks + 1
+        outer = self.padding_chunks + self.ring_chunks
+
+        vx0 = left // chunk_px
+        vy0 = top // chunk_px
+        vx1 = (left + screen_w - 1) // chunk_px
+        vy1 = (top + screen_h - 1) // chunk_px
+
+        ix0, iy0, ix1, iy1 = vx0 - inner, vy0 - inner, vx1 + inner, vy1 + inner
+
+        for cy in range(vy0 - outer, vy1 + outer + 1):
+            row_inside = iy0 < cy < iy1
+            for cx in range(vx0 - outer, vx1 + outer + 1):
+                if row_inside and ix0 < cx < ix1:
+                    continue
+                world_map.prefetch(cx, cy, self.executor)
+
+    def close(self) -> None:
+        """
+        Stop the worker pool, dropping jobs that have not started.
+        """
+        self.executor.shutdown(wait=False, cancel_futures=True)
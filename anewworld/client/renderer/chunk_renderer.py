@@ -4,9 +4,14 @@ Chunk-based renderer with surface caching.
 
 from __future__ import annotations
 
-from collections import deque
-from dataclasses import dataclass
-
+import heapq
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import product
+
+import numpy as np
+import numpy.typing as npt
 import pygame
 
 from anewworld.shared.utils.lru_cache import LRUCache
@@ -15,17 +20,10 @@ from anewworld.shared.world_map import WorldMap
 from .camera import Camera
 from .terrain_palette import TerrainPalette
 
-
-@dataclass(slots=True)
-class _CachedChunkSurface:
-    """
-    Cached rendering surface for a chunk.
-    """
-
-    surface: pygame.Surface
-    """
-    Pre-rendered chunk surface.
-    """
+_PLACEHOLDER_COLOR = (200, 50, 200)
+"""
+RGB color filled in for visible chunks whose surface is not built yet.
+"""
 
 
 @dataclass(slots=True)
@@ -65,14 +63,16 @@ class ChunkRenderer:
     Maximum time to spend building new chunk surfaces per frame.
     """
 
-    _cache: LRUCache[tuple[int, int], _CachedChunkSurface]
+    _cache: LRUCache[tuple[int, int], pygame.Surface]
     """
     Cached surfaces keyed by chunk coordinates.
     """
 
-    _build_queue: deque[tuple[int, int]]
+    _build_queue: list[tuple[int, tuple[int, int]]]
     """
-    Queue of chunk keys awaiting surface construction.
+    Min-heap of chunk keys awaiting surface construction, ordered by
+    squared chunk distance to the view center at the time they were
+    queued.
     """
 
     _build_set: set[tuple[int, int]]
@@ -80,9 +80,57 @@ class ChunkRenderer:
     Set of queued chunk keys to avoid duplicates.
     """
 
-    _placeholder: pygame.Surface
+    _chunk_px: int
+    """
+    Width and height of a chunk in pixels.
+    """
+
+    _content_cache: LRUCache[bytes, pygame.Surface]
+    """
+    Built surfaces keyed by raw chunk terrain, shared by identical chunks.
+    """
+
+    _solid: dict[int, pygame.Surface] = field(default_factory=dict)
+    """
+    Solid chunk surfaces keyed by tile value, shared by single-terrain
+    chunks.
+    """
+
+    _executor: ThreadPoolExecutor = field(
+        default_factory=lambda: ThreadPoolExecutor(max_workers=1)
+    )
     """
-    Placeholder surface used for chunks not yet built.
+    Worker building chunk surfaces off the render thread.
+    """
+
+    _pending: dict[tuple[int, int], tuple[bytes, Future[pygame.Surface]]] = field(
+        default_factory=dict
+    )
+    """
+    In-flight surface builds keyed by chunk coordinates, with the raw
+    terrain they were built from.
+    """
+
+    _last_cam: tuple[int, int] | None = None
+    """
+    Camera position, in world pixels, used for the previous draw.
+    """
+
+    _enqueued_key: tuple[int, int, int, int] | None = None
+    """
+    Padded chunk bounds whose missing surfaces are already queued.
+
+    Reset when a surface is evicted so it gets queued again if needed.
+    """
+
+    _visible_key: tuple[int, int, int, int] | None = None
+    """
+    Viewport chunk bounds `_visible` was computed for.
+    """
+
+    _visible: list[tuple[tuple[int, int], int, int]] = field(default_factory=list)
+    """
+    Chunk keys in the viewport with their world pixel origins.
     """
 
     @classmethod
@@ -122,15 +170,11 @@ class ChunkRenderer:
         if palette is None:
             palette = TerrainPalette()
 
-        placeholder_px = chunk_size * tile_size
-        placeholder = pygame.Surface((placeholder_px, placeholder_px)).convert()
-        placeholder.fill((200, 50, 200))
+        chunk_px = chunk_size * tile_size
 
-        cache = LRUCache[tuple[int, int], _CachedChunkSurface](
-            capacity=max_cached_chunks
-        )
+        cache = LRUCache[tuple[int, int], pygame.Surface](capacity=max_cached_chunks)
 
-        return cls(
+        renderer = cls(
             tile_size=tile_size,
             chunk_size=chunk_size,
             max_cached_chunks=max_cached_chunks,
@@ -138,10 +182,13 @@ class ChunkRenderer:
             palette=palette,
             build_budget_ms=build_budget_ms,
             _cache=cache,
-            _build_queue=deque(),
+            _build_queue=[],
             _build_set=set(),
-            _placeholder=placeholder,
+            _content_cache=LRUCache(capacity=max_cached_chunks),
+            _chunk_px=chunk_px,
         )
+        cache.on_evict = renderer._on_evict
+        return renderer
 
     def draw(
         self,
@@ -149,7 +196,7 @@ class ChunkRenderer:
         screen: pygame.Surface,
         world_map: WorldMap,
         camera: Camera,
-    ) -> None:
+    ) -> list[pygame.Rect]:
         """
         Draw visible chunks to the screen.
 
@@ -161,50 +208,180 @@ class ChunkRenderer:
             World map to render.
         camera : Camera
             Camera describing visible region in world px.
+
+        Returns
+        -------
+        list[pygame.Rect]
+            Screen areas that changed since the previous draw. The whole
+            screen if the camera moved, otherwise the newly built chunks.
         """
+        chunk_px = self._chunk_px
+
+        cam_x = int(round(camera.x_px))
+        cam_y = int(round(camera.y_px))
+
         screen_w = screen.get_width()
         screen_h = screen.get_height()
 
-        tile_size = self.tile_size
-        chunk_size = self.chunk_size
-        chunk_px = chunk_size * tile_size
+        vx0, vy0, vx1, vy1 = self._visible_bounds(
+            camera=camera,
+            screen_w=screen_w,
+            screen_h=screen_h,
+        )
 
-        cam_x = int(round(camera.x_px))
-        cam_y = int(round(camera.y_px))
+        # Every screen pixel is covered by a chunk or a placeholder fill, so
+        # the caller does not need to clear the screen first.
+        assert vx0 * chunk_px <= cam_x and (vx1 + 1) * chunk_px >= cam_x + screen_w
+        assert vy0 * chunk_px <= cam_y and (vy1 + 1) * chunk_px >= cam_y + screen_h
+
+        pad = self.padding_chunks
+        padded = (vx0 - pad, vy0 - pad, vx1 + pad, vy1 + pad)
+        if padded != self._enqueued_key:
+            self._enqueued_key = padded
+            self._enqueue_visible(
+                cx0=padded[0],
+                cy0=padded[1],
+                cx1=padded[2],
+                cy1=padded[3],
+            )
+        built = self._collect_built()
+        built += self._submit_budgeted(world_map=world_map, window=padded)
+
+        bounds = (vx0, vy0, vx1, vy1)
+        if bounds != self._visible_key:
+            self._visible_key = bounds
+            # Padding chunks are only built ahead of time; just blit what is
+            # on screen.
+            self._visible = [
+                (key, key[0] * chunk_px, key[1] * chunk_px)
+                for key in product(range(vx0, vx1 + 1), range(vy0, vy1 + 1))
+            ]
+            # Recency only needs refreshing when the visible set changes;
+            # per-frame lookups below use peek.
+            self._cache.touch_many(key for key, _, _ in self._visible)
+
+        get = self._cache.peek
+        fill = screen.fill
+        blits: list[tuple[pygame.Surface, tuple[int, int]]] = []
+        for key, wx, wy in self._visible:
+            x = wx - cam_x
+            y = wy - cam_y
+            surf = get(key)
+            if surf is None:
+                fill(_PLACEHOLDER_COLOR, (x, y, chunk_px, chunk_px))
+            else:
+                blits.append((surf, (x, y)))
+
+        screen.blits(blits, doreturn=False)
+
+        cam = (cam_x, cam_y)
+        if cam != self._last_cam:
+            self._last_cam = cam
+            return [screen.get_rect()]
+
+        screen_rect = screen.get_rect()
+        return [
+            pygame.Rect(
+                cx * chunk_px - cam_x, cy * chunk_px - cam_y, chunk_px, chunk_px
+            ).clip(screen_rect)
+            for cx, cy in built
+            if vx0 <= cx <= vx1 and vy0 <= cy <= vy1
+        ]
+
+    def prewarm(
+        self,
+        *,
+        screen: pygame.Surface,
+        world_map: WorldMap,
+        camera: Camera,
+    ) -> None:
+        """
+        Build every chunk surface around the camera, ignoring the budget.
+
+        Meant to be called once before the first frame so the initial view
+        does not start out as placeholders.
+
+        Parameters
+        ----------
+        screen : pygame.Surface
+            Destination surface the renderer will draw to.
+        world_map : WorldMap
+            World map providing terrain data.
+        camera : Camera
+            Camera describing visible region in world px.
+        """
+        vx0, vy0, vx1, vy1 = self._visible_bounds(
+            camera=camera,
+            screen_w=screen.get_width(),
+            screen_h=screen.get_height(),
+        )
+
+        pad = self.padding_chunks
+        xs = range(vx0 - pad, vx1 + pad + 1)
+        ys = range(vy0 - pad, vy1 + pad + 1)
+        for key in product(xs, ys):
+            if key in self._cache:
+                continue
+            cx, cy = key
+            surf = self._build_chunk_surface(world_map=world_map, cx=cx, cy=cy)
+            self._cache.put(key, surf)
+
+    def _visible_bounds(
+        self,
+        *,
+        camera: Camera,
+        screen_w: int,
+        screen_h: int,
+    ) -> tuple[int, int, int, int]:
+        """
+        Compute the inclusive chunk range intersecting the viewport.
 
-        left = cam_x
-        top = cam_y
-        right = cam_x + screen_w
-        bottom = cam_y + screen_h
+        Parameters
+        ----------
+        camera : Camera
+            Camera describing visible region in world px.
+        screen_w : int
+            Screen width in pixels.
+        screen_h : int
+            Screen height in pixels.
 
-        cx0 = (left // chunk_px) - self.padding_chunks
-        cy0 = (top // chunk_px) - self.padding_chunks
-        cx1 = ((right - 1) // chunk_px) + self.padding_chunks
-        cy1 = ((bottom - 1) // chunk_px) + self.padding_chunks
+        Returns
+        -------
+        tuple[int, int, int, int]
+            (cx0, cy0, cx1, cy1) chunk bounds, inclusive.
+        """
+        chunk_px = self._chunk_px
 
-        self._enqueue_visible(cx0=cx0, cy0=cy0, cx1=cx1, cy1=cy1)
-        self._build_budgeted(world_map=world_map)
+        left = int(round(camera.x_px))
+        top = int(round(camera.y_px))
+        right = left + screen_w
+        bottom = top + screen_h
 
-        blit = screen.blit
-        placeholder = self._placeholder
+        cx0 = left // chunk_px
+        cy0 = top // chunk_px
+        cx1 = (right - 1) // chunk_px
+        cy1 = (bottom - 1) // chunk_px
+        return cx0, cy0, cx1, cy1
 
-        for cy in range(cy0, cy1 + 1):
-            dest_y = cy * chunk_px - cam_y
-            for cx in range(cx0, cx1 + 1):
-                key = (cx, cy)
-                cached = self._cache.get(key)
-                if cached is None:
-                    surf = placeholder
-                else:
-                    surf = cached.surface
+    def _on_evict(self, key: tuple[int, int], value: pygame.Surface) -> None:
+        """
+        Invalidate the queued-bounds memo when a surface leaves the cache.
 
-                dest_x = cx * chunk_px - cam_x
-                blit(surf, (dest_x, dest_y))
+        Parameters
+        ----------
+        key : tuple[int, int]
+            Evicted chunk coordinates.
+        value : pygame.Surface
+            Evicted surface.
+        """
+        self._enqueued_key = None
 
     def _enqueue_visible(self, *, cx0: int, cy0: int, cx1: int, cy1: int) -> None:
         """
         Queue missing chunk surfaces for the current visible region.
 
+        Chunks nearest the center of the region are built first.
+
         Parameters
         ----------
         cx0 : int
@@ -216,75 +393,121 @@ class ChunkRenderer:
         cy1 : int
             Maximum visible chunk Y.
         """
-        for cy in range(cy0, cy1 + 1):
-            for cx in range(cx0, cx1 + 1):
-                key = (cx, cy)
-                if key in self._cache or key in self._build_set:
-                    continue
-                self._build_queue.append(key)
-                self._build_set.add(key)
-
-    def _build_budgeted(self, *, world_map: WorldMap) -> None:
+        # Strip queued and in-flight keys with one C-level set operation;
+        # only the cache, which is an LRU, still needs a per-key check.
+        window = set(product(range(cx0, cx1 + 1), range(cy0, cy1 + 1)))
+        window.difference_update(self._build_set, self._pending)
+
+        cache = self._cache
+        missing = [key for key in window if key not in cache]
+        self._build_set.update(missing)
+
+        ccx = (cx0 + cx1) // 2
+        ccy = (cy0 + cy1) // 2
+        queue = self._build_queue
+        for key in missing:
+            dx = key[0] - ccx
+            dy = key[1] - ccy
+            heapq.heappush(queue, (dx * dx + dy * dy, key))
+
+    def _submit_budgeted(
+        self,
+        *,
+        world_map: WorldMap,
+        window: tuple[int, int, int, int],
+    ) -> list[tuple[int, int]]:
         """
-        Build queued chunk surfaces up to the per-frame time budget.
+        Hand queued chunks to the build worker up to the per-frame budget.
+
+        Chunk data is read here, on the thread that owns the world map;
+        the worker only turns terrain arrays into surfaces. Chunks whose
+        terrain is not generated yet are prefetched on the worker and
+        retried on a later frame. Chunks that can reuse an existing
+        surface are cached immediately. Chunks queued for an earlier
+        window that are no longer inside `window` are dropped.
 
         Parameters
         ----------
         world_map : WorldMap
             World map providing terrain data.
+        window : tuple[int, int, int, int]
+            Current padded (cx0, cy0, cx1, cy1) chunk bounds, inclusive.
+
+        Returns
+        -------
+        list[tuple[int, int]]
+            Keys of the chunks cached without going through the worker.
         """
-        import time
+        cached: list[tuple[int, int]] = []
+        queue = self._build_queue
+        if not queue:
+            return cached
+
+        deferred: list[tuple[int, tuple[int, int]]] = []
+        clock = time.perf_counter_ns
+        deadline_ns = clock() + int(self.build_budget_ms * 1_000_000)
+        wx0, wy0, wx1, wy1 = window
+
+        while queue and clock() < deadline_ns:
+            priority, key = heapq.heappop(queue)
+            cx, cy = key
+            self._build_set.discard(key)
 
-        if not self._build_queue:
-            return
+            if not (wx0 <= cx <= wx1 and wy0 <= cy <= wy1):
+                continue
 
-        t0 = time.perf_counter()
-        budget = self.build_budget_ms / 1000.0
+            if key in self._cache or key in self._pending:
+                continue
 
-        while self._build_queue and (time.perf_counter() - t0) < budget:
-            cx, cy = self._build_queue.popleft()
-            key = (cx, cy)
-            self._build_set.discard(key)
+            if not world_map.is_ready(cx, cy):
+                world_map.prefetch(cx, cy, self._executor)
+                deferred.append((priority, key))
+                continue
 
-            if key in self._cache:
+            terrain = world_map.chunk_at(cx, cy).terrain
+            content_key = terrain.tobytes()
+            shared = self._solid_surface(terrain)
+            if shared is None:
+                shared = self._content_cache.get(content_key)
+            if shared is not None:
+                self._cache.put(key, shared)
+                cached.append(key)
                 continue
 
-            surf = self._build_chunk_surface(world_map=world_map, cx=cx, cy=cy)
-            self._cache.put(key, _CachedChunkSurface(surface=surf))
+            future = self._executor.submit(self._render_terrain, terrain)
+            self._pending[key] = (content_key, future)
 
-    def _get_chunk_surface(
-        self,
-        *,
-        world_map: WorldMap,
-        cx: int,
-        cy: int,
-    ) -> pygame.Surface:
-        """
-        Retrieve a cached chunk surface if available.
+        for entry in deferred:
+            heapq.heappush(queue, entry)
+            self._build_set.add(entry[1])
+        return cached
 
-        Parameters
-        ----------
-        world_map : WorldMap
-            World map providing terrain data.
-        cx : int
-            Chunk X coordinate.
-        cy : int
-            Chunk Y coordinate.
+    def _collect_built(self) -> list[tuple[int, int]]:
+        """
+        Move surfaces finished by the build worker into the cache.
 
         Returns
         -------
-        pygame.Surface
-            Cached surface for the chunk, or the placeholder if missing.
+        list[tuple[int, int]]
+            Keys of the chunks collected during this call.
         """
-        key = (cx, cy)
-        cached = self._cache.get(key)
-        if cached is None:
-            if key not in self._build_set:
-                self._build_queue.append(key)
-                self._build_set.add(key)
-            return self._placeholder
-
-        return cached.surface
+        pending = self._pending
+        built = [key for key, (_, future) in pending.items() if future.done()]
+        for key in built:
+            content_key, future = pending.pop(key)
+            surface = self._content_cache.get(content_key)
+            if surface is None:
+                surface = future.result()
+                self._content_cache.put(content_key, surface)
+            self._cache.put(key, surface)
+
+        return built
+
+    def close(self) -> None:
+        """
+        Stop the build worker, dropping builds that have not started.
+        """
+        self._executor.shutdown(wait=False, cancel_futures=True)
 
     def _build_chunk_surface(
         self,
@@ -294,7 +517,7 @@ class ChunkRenderer:
         cy: int,
     ) -> pygame.Surface:
         """
-        Build a surface for a chunk by drawing all tiles in it once.
+        Build a surface for a chunk on the calling thread.
 
         Parameters
         ----------
@@ -310,31 +533,78 @@ class ChunkRenderer:
         pygame.Surface
             Newly created surface containing the chunk's pixels.
         """
-        tile_size = self.tile_size
-        chunk_size = self.chunk_size
-        chunk_px = chunk_size * tile_size
+        chunk = world_map.chunk_at(cx, cy)
 
-        surface = pygame.Surface((chunk_px, chunk_px)).convert()
+        solid = self._solid_surface(chunk.terrain)
+        if solid is not None:
+            return solid
 
-        base_x = cx * chunk_size
-        base_y = cy * chunk_size
+        # Chunk surfaces are never drawn on, so chunks with identical
+        # terrain can share one.
+        content_key = chunk.terrain.tobytes()
+        shared = self._content_cache.get(content_key)
+        if shared is not None:
+            return shared
 
-        tile_for: dict[object, pygame.Surface] = {}
+        surface = self._render_terrain(chunk.terrain)
+        self._content_cache.put(content_key, surface)
+        return surface
 
-        for ly in range(chunk_size):
-            wy = base_y + ly
-            py = ly * tile_size
-            for lx in range(chunk_size):
-                wx = base_x + lx
-                px = lx * tile_size
+    def _solid_surface(self, terrain: npt.NDArray[np.uint8]) -> pygame.Surface | None:
+        """
+        Return the shared surface for a chunk made of a single terrain.
 
-                terrain = world_map.terrain_at(wx, wy)
+        Open water and large biomes produce many such chunks; they are
+        filled with one color instead of going through the tile path.
 
-                tile = tile_for.get(terrain)
-                if tile is None:
-                    tile = self.palette.surface_for(terrain, tile_size=tile_size)
-                    tile_for[terrain] = tile
+        Parameters
+        ----------
+        terrain : npt.NDArray[np.uint8]
+            Raw tile values of the chunk.
 
-                surface.blit(tile, (px, py))
+        Returns
+        -------
+        pygame.Surface | None
+            Solid surface, or None if the chunk mixes terrain types.
+        """
+        tile = int(terrain[0, 0])
+        if not (terrain == tile).all():
+            return None
+
+        surface = self._solid.get(tile)
+        if surface is None:
+            surface = pygame.Surface((self._chunk_px, self._chunk_px)).convert()
+            surface.fill(self.palette.colors_for(terrain[0, 0]).tolist())
+            self._solid[tile] = surface
+        return surface
+
+    def _render_terrain(self, terrain: npt.NDArray[np.uint8]) -> pygame.Surface:
+        """
+        Render a chunk terrain array into a new surface in one copy.
+
+        Touches no renderer or world map state, so it is safe to run on the
+        build worker.
+
+        Parameters
+        ----------
+        terrain : npt.NDArray[np.uint8]
+            Raw tile values of the chunk, indexed [y, x].
+
+        Returns
+        -------
+        pygame.Surface
+            Newly created surface containing the chunk's pixels.
+        """
+        chunk_size = self.chunk_size
+        chunk_px = self._chunk_px
+
+        # One pixel per tile; surfarray is indexed [x, y], terrain is [y, x].
+        tiles = pygame.Surface((chunk_size, chunk_size)).convert()
+        pygame.surfarray.blit_array(
+            tiles, self.palette.colors_for(terrain).swapaxes(0, 1)
+        )
 
+        # Nearest-neighbour upscale turns each pixel into a solid tile.
+        surface = pygame.Surface((chunk_px, chunk_px)).convert()
+        pygame.transform.scale(tiles, (chunk_px, chunk_px), surface)
         return surface
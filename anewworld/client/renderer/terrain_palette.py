@@ -4,12 +4,22 @@ Palette mappings used by the renderer.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
+import numpy as np
+import numpy.typing as npt
 import pygame
 
 from anewworld.shared.tile_type import TileType
 
+_SURFACE_CACHE: dict[tuple[int, TileType], pygame.Surface] = {}
+"""
+Per-process surface cache shared across TerrainPalette instances.
+
+The cache is keyed by (tile_size, terrain) and stores converted surfaces
+for fast blitting.
+"""
+
 
 @dataclass(frozen=True, slots=True)
 class TerrainPalette:
@@ -42,6 +52,39 @@ class TerrainPalette:
     RGB color for unknown tiles.
     """
 
+    _color_map: dict[TileType, tuple[int, int, int]] = field(
+        init=False, repr=False, compare=False
+    )
+    """
+    RGB color for each known terrain type.
+    """
+
+    _lut: npt.NDArray[np.uint8] = field(init=False, repr=False, compare=False)
+    """
+    RGB lookup table of shape (256, 3) indexed by raw tile value; values
+    without a TileType map to the unknown color.
+    """
+
+    def __post_init__(self) -> None:
+        """
+        Build the terrain to color mapping and RGB lookup table.
+        """
+        color_map = {
+            TileType.DEFAULT_GRASS: self.land,
+            TileType.DEFAULT_WATER: self.water,
+            TileType.DARK_GRASS: self.rainforest,
+            TileType.DEEP_WATER: self.deepwater,
+        }
+
+        lut = np.empty((256, 3), dtype=np.uint8)
+        lut[:] = self.unknown
+        for terrain, color in color_map.items():
+            lut[terrain] = color
+        lut.setflags(write=False)
+
+        object.__setattr__(self, "_color_map", color_map)
+        object.__setattr__(self, "_lut", lut)
+
     def surface_for(self, terrain: TileType, *, tile_size: int) -> pygame.Surface:
         """
         Map a terrain type to a pre-colored tile surface.
@@ -59,43 +102,46 @@ class TerrainPalette:
             A surface of size (tile_size, tile_size) filled with the
             terrain's color, converted for fast blitting.
         """
-        cache = self._surface_cache()
         key = (tile_size, terrain)
 
-        surf = cache.get(key)
+        surf = _SURFACE_CACHE.get(key)
         if surf is not None:
             return surf
 
-        color = self._color_for(terrain)
+        color = self.color_for(terrain)
         surf = pygame.Surface((tile_size, tile_size)).convert()
         surf.fill(color)
-        cache[key] = surf
+        _SURFACE_CACHE[key] = surf
         return surf
 
-    def _color_for(self, terrain: TileType) -> tuple[int, int, int]:
+    def color_for(self, terrain: TileType) -> tuple[int, int, int]:
         """
         Map a terrain type to an RGB color.
+
+        Parameters
+        ----------
+        terrain : TileType
+            Terrain type to map.
+
+        Returns
+        -------
+        tuple[int, int, int]
+            RGB color for the terrain.
         """
-        if terrain == TileType.DEFAULT_GRASS:
-            return self.land
-        if terrain == TileType.DEFAULT_WATER:
-            return self.water
-        if terrain == TileType.DARK_GRASS:
-            return self.rainforest
-        if terrain == TileType.DEEP_WATER:
-            return self.deepwater
-        return self.unknown
-
-    @staticmethod
-    def _surface_cache() -> dict[tuple[int, TileType], pygame.Surface]:
+        return self._color_map.get(terrain, self.unknown)
+
+    def colors_for(self, tile_ids: npt.NDArray[np.uint8]) -> npt.NDArray[np.uint8]:
         """
-        Per-process surface cache shared across TerrainPalette instances.
+        Map an array of raw tile values to RGB colors in one gather.
+
+        Parameters
+        ----------
+        tile_ids : npt.NDArray[np.uint8]
+            Raw tile values of any shape.
 
-        The cache is keyed by (tile_size, terrain) and stores converted
-        surfaces for fast blitting.
+        Returns
+        -------
+        npt.NDArray[np.uint8]
+            Array of shape tile_ids.shape + (3,) holding each tile's color.
         """
-        cache = getattr(TerrainPalette._surface_cache, "_cache", None)
-        if cache is None:
-            cache = {}
-            TerrainPalette._surface_cache._cache = cache  # type: ignore[attr-defined]
-        return cache
+        return self._lut[tile_ids]
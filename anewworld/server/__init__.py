@@ -5,16 +5,19 @@ Network server for basic player id assignment and session tracking.
 from __future__ import annotations
 
 import asyncio
-import json
+import contextlib
 import logging
 import time
-from dataclasses import dataclass
-from typing import Any
+from collections.abc import Awaitable
+from dataclasses import dataclass, field
+from typing import Any, Protocol
+
+import msgpack
 
 from .inventory_registry import InventoryRegistry
 from .services.inventory_service import InventoryService
-from .services.player_service import PlayerContext, PlayerService
-from .services.world_service import WorldService
+from .services.player_service import PlayerService
+from .services.world_service import SendFn, WorldService
 from .sessions import SessionRegistry
 from .world_edits_registry import WorldEditsRegistry
 from .world_edits_store import WorldEditsStore
@@ -22,9 +25,48 @@ from .world_edits_store import WorldEditsStore
 logger = logging.getLogger(__name__)
 
 
+_HEADER_SIZE = 4
+"""
+Size of the big-endian length prefix preceding every frame, in bytes.
+"""
+
+_MAX_FRAME_SIZE = 1 << 20
+"""
+Largest accepted inbound frame payload, in bytes.
+"""
+
+_READ_SIZE = 65536
+"""
+Maximum number of bytes requested from a client stream per read.
+"""
+
+_WRITE_HIGH_WATER = 256 * 1024
+"""
+Transport write buffer size, in bytes, above which senders to a client wait
+for its socket to drain.
+"""
+
+_WRITE_LOW_WATER = 64 * 1024
+"""
+Transport write buffer size, in bytes, at which paused senders resume.
+"""
+
+_OUTBOX_FRAMES = 1024
+"""
+Maximum number of frames queued for one client before senders wait.
+"""
+
+_PACKER = msgpack.Packer(use_bin_type=True)
+"""
+Reused MessagePack encoder for outgoing frames.
+
+Only used from the event loop thread, so it is never packing concurrently.
+"""
+
+
 def _dumps(obj: dict[str, Any]) -> bytes:
     """
-    Encode a message as newline-delimited JSON bytes.
+    Encode a message as a length-prefixed MessagePack frame.
 
     Parameters
     ----------
@@ -34,9 +76,37 @@ def _dumps(obj: dict[str, Any]) -> bytes:
     Returns
     -------
     bytes
-        UTF-8 encoded JSON message terminated by a newline.
+        Big-endian payload length followed by the MessagePack payload.
+    """
+    payload: bytes = _PACKER.pack(obj)
+    return len(payload).to_bytes(_HEADER_SIZE, "big") + payload
+
+
+_BAD_MESSAGE_FRAME = _dumps({"t": "error", "reason": "bad_message"})
+"""
+Pre-encoded error frame sent for payloads that do not decode to a message.
+"""
+
+_UNKNOWN_MESSAGE_FRAME = _dumps({"t": "error", "reason": "unknown_message"})
+"""
+Pre-encoded error frame sent for messages with no registered handler.
+"""
+
+
+class _MessageHandler(Protocol):
+    """
+    Async handler for one inbound message type.
     """
-    return (json.dumps(obj, separators=(",", ":")) + "\n").encode("utf-8")
+
+    def __call__(
+        self,
+        writer: asyncio.StreamWriter,
+        msg: dict[str, Any],
+        /,
+        *,
+        peer: Any,
+        send: SendFn,
+    ) -> Awaitable[None]: ...
 
 
 @dataclass(slots=True)
@@ -75,6 +145,21 @@ class GameServer:
     World service responsible for chunk subscriptions and world edit snapshots.
     """
 
+    _outboxes: dict[asyncio.StreamWriter, asyncio.Queue[bytes | None]] = field(
+        default_factory=dict
+    )
+    """
+    Encoded frames waiting to be written, per connected client.
+
+    Each queue is drained by that client's writer task; None tells the task
+    to flush and stop.
+    """
+
+    _handlers: dict[str, _MessageHandler] = field(default_factory=dict)
+    """
+    Message type to handler dispatch table.
+    """
+
     @classmethod
     def new(
         cls,
@@ -128,7 +213,7 @@ class GameServer:
             debug=debug,
         )
 
-        return cls(
+        server = cls(
             sessions=sessions,
             inventories=inventories,
             debug=debug,
@@ -136,6 +221,14 @@ class GameServer:
             _inventory_service=_inventory_service,
             _world_service=_world_service,
         )
+        server._handlers = {
+            "request_id": server._handle_request_id,
+            "request_inventory": _inventory_service.handle_request_inventory,
+            "sub_chunk": _world_service.handle_sub_chunk,
+            "unsub_chunk": _world_service.handle_unsub_chunk,
+            "request_chunk_edits": _world_service.handle_request_chunk_edits,
+        }
+        return server
 
     def _log_debug(self, msg: str, *args: Any) -> None:
         """
@@ -231,63 +324,25 @@ class GameServer:
         peer = writer.get_extra_info("peername")
         self._log_info("Client connected: %s", peer)
 
+        writer.transport.set_write_buffer_limits(
+            high=_WRITE_HIGH_WATER,
+            low=_WRITE_LOW_WATER,
+        )
+
+        outbox: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize=_OUTBOX_FRAMES)
+        self._outboxes[writer] = outbox
+        writer_task = asyncio.create_task(self._write_loop(writer, outbox, peer=peer))
+
+        rxbuf = bytearray()
+
         try:
             while True:
-                line = await reader.readline()
-                if not line:
+                payloads = await self._read_frames(reader, rxbuf, peer=peer)
+                if payloads is None:
                     break
 
-                self._player_service.touch(writer)
-
-                msg = self._parse(line)
-                if msg is None:
-                    self._log_warning("Bad JSON from %s: %r", peer, line[:200])
-                    await self._send(writer, {"t": "error", "reason": "bad_json"})
-                    continue
-
-                msg_type = msg.get("t")
-
-                if msg_type == "request_id":
-                    await self._handle_request_id(writer, peer=peer)
-                    continue
-
-                if msg_type == "request_inventory":
-                    await self._inventory_service.handle_request_inventory(
-                        writer,
-                        peer=peer,
-                        send=self._send,
-                    )
-                    continue
-
-                if msg_type == "sub_chunk":
-                    await self._world_service.handle_sub_chunk(
-                        writer,
-                        msg,
-                        peer=peer,
-                        send=self._send,
-                    )
-                    continue
-
-                if msg_type == "unsub_chunk":
-                    await self._world_service.handle_unsub_chunk(
-                        writer,
-                        msg,
-                        peer=peer,
-                        send=self._send,
-                    )
-                    continue
-
-                if msg_type == "request_chunk_edits":
-                    await self._world_service.handle_request_chunk_edits(
-                        writer,
-                        msg,
-                        peer=peer,
-                        send=self._send,
-                    )
-                    continue
-
-                self._log_warning("Unknown message from %s: %s", peer, msg_type)
-                await self._send(writer, {"t": "error", "reason": "unknown_message"})
+                for payload in payloads:
+                    await self._handle_payload(writer, payload, peer=peer)
         except ConnectionResetError:
             self._log_info("Client reset connection: %s", peer)
         except Exception:
@@ -307,17 +362,117 @@ class GameServer:
             else:
                 self._log_info("Client disconnected: %s active=%d", peer, active)
 
+            del self._outboxes[writer]
+            await outbox.put(None)
+            await writer_task
+
             writer.close()
             await writer.wait_closed()
 
-    def _parse(self, line: bytes) -> dict[str, Any] | None:
+    async def _handle_payload(
+        self,
+        writer: asyncio.StreamWriter,
+        payload: bytes,
+        *,
+        peer: Any,
+    ) -> None:
+        """
+        Decode one frame payload and dispatch it to its handler.
+
+        Parameters
+        ----------
+        writer : asyncio.StreamWriter
+            Stream writer associated with the client connection.
+        payload : bytes
+            Raw frame payload received from the client.
+        peer : Any
+            Peer name reported by asyncio (typically (ip, port)).
+
+        Returns
+        -------
+        None
         """
-        Parse a single newline-delimited JSON message.
+        self._player_service.touch(writer)
+
+        msg = self._parse(payload)
+        if msg is None:
+            self._log_warning("Bad message from %s: %r", peer, payload[:200])
+            await self._send_raw(writer, _BAD_MESSAGE_FRAME)
+            return
+
+        msg_type = msg.get("t")
+        handler = self._handlers.get(msg_type) if isinstance(msg_type, str) else None
+        if handler is not None:
+            await handler(writer, msg, peer=peer, send=self._send)
+            return
+
+        self._log_warning("Unknown message from %s: %s", peer, msg_type)
+        await self._send_raw(writer, _UNKNOWN_MESSAGE_FRAME)
+
+    async def _read_frames(
+        self,
+        reader: asyncio.StreamReader,
+        rxbuf: bytearray,
+        *,
+        peer: Any,
+    ) -> list[bytes] | None:
+        """
+        Read the next chunk from a client and split off every complete frame.
+
+        One read may yield many frames, so a burst of small messages costs
+        a single wakeup instead of two per message. Bytes of a trailing
+        partial frame stay in `rxbuf` for the next call.
 
         Parameters
         ----------
-        line : bytes
-            Raw bytes received from the client.
+        reader : asyncio.StreamReader
+            Stream reader associated with the client connection.
+        rxbuf : bytearray
+            Receive buffer holding bytes not yet consumed as frames.
+        peer : Any
+            Peer name reported by asyncio (typically (ip, port)).
+
+        Returns
+        -------
+        list[bytes] | None
+            Frame payloads in arrival order (possibly empty), or None if the
+            stream ended or the client announced a frame larger than the
+            accepted maximum.
+        """
+        data = await reader.read(_READ_SIZE)
+        if not data:
+            return None
+        rxbuf += data
+
+        n = len(rxbuf)
+        off = 0
+        payloads: list[bytes] = []
+        while n - off >= _HEADER_SIZE:
+            start = off + _HEADER_SIZE
+            size = int.from_bytes(rxbuf[off:start], "big")
+            if size > _MAX_FRAME_SIZE:
+                self._log_warning("Oversized frame from %s: %d bytes", peer, size)
+                return None
+
+            end = start + size
+            if end > n:
+                break
+
+            payloads.append(bytes(rxbuf[start:end]))
+            off = end
+
+        if off:
+            del rxbuf[:off]
+        return payloads
+
+    def _parse(self, payload: bytes) -> dict[str, Any] | None:
+        """
+        Parse a single MessagePack frame payload.
+
+        Parameters
+        ----------
+        payload : bytes
+            Raw frame payload received from the client.
 
         Returns
         -------
@@ -325,8 +480,8 @@ class GameServer:
             Parsed message dictionary if valid, otherwise None.
         """
         try:
-            obj = json.loads(line.decode("utf-8"))
-        except json.JSONDecodeError:
+            obj = msgpack.unpackb(payload, raw=False)
+        except ValueError:
             return None
 
         if not isinstance(obj, dict):
@@ -337,8 +492,10 @@ class GameServer:
     async def _handle_request_id(
         self,
         writer: asyncio.StreamWriter,
+        msg: dict[str, Any],
         *,
         peer: Any,
+        send: SendFn,
     ) -> None:
         """
         Handle a client request for a player identifier.
@@ -351,20 +508,28 @@ class GameServer:
         ----------
         writer : asyncio.StreamWriter
             Stream writer associated with the requesting client.
+        msg : dict[str, Any]
+            Message payload (unused).
         peer : Any
             Peer name reported by asyncio (typically (ip, port)).
+        send : SendFn
+            Async callable of the form: await send(writer, obj).
 
         Returns
         -------
         None
         """
-        ctx = PlayerContext(writer=writer, peer=peer, now_s=time.time())
-        player_id = await self._player_service.handle_request_id(ctx, send=self._send)
+        player_id = await self._player_service.handle_request_id(
+            writer,
+            peer=peer,
+            now_s=time.time(),
+            send=send,
+        )
 
         await self._inventory_service.send_inventory(
             writer,
             player_id=player_id,
-            send=self._send,
+            send=send,
         )
 
     async def _send(
@@ -373,7 +538,13 @@ class GameServer:
         obj: dict[str, Any],
     ) -> None:
         """
-        Send a single message to a client.
+        Queue a single message for a client.
+
+        The frame is written by the client's writer task. This waits only
+        while the client's outbox is full or its transport buffer is past
+        the high-water mark, so a client that stops reading throttles
+        whoever is sending to it. Messages for clients that already
+        disconnected are dropped.
 
         Parameters
         ----------
@@ -386,5 +557,90 @@ class GameServer:
         -------
         None
         """
-        writer.write(_dumps(obj))
-        await writer.drain()
+        await self._send_raw(writer, _dumps(obj))
+
+    async def _send_raw(
+        self,
+        writer: asyncio.StreamWriter,
+        frame: bytes,
+    ) -> None:
+        """
+        Queue an already encoded frame for a client.
+
+        Waits while the client's outbox is full, then waits for the socket
+        to drain if the transport buffer is past the high-water mark.
+
+        Parameters
+        ----------
+        writer : asyncio.StreamWriter
+            Stream writer for the client connection.
+        frame : bytes
+            Length-prefixed MessagePack frame.
+
+        Returns
+        -------
+        None
+        """
+        outbox = self._outboxes.get(writer)
+        if outbox is not None:
+            await outbox.put(frame)
+            if writer.transport.get_write_buffer_size() > _WRITE_HIGH_WATER:
+                # Failures surface in the client's own writer task.
+                with contextlib.suppress(ConnectionError):
+                    await writer.drain()
+
+    async def _write_loop(
+        self,
+        writer: asyncio.StreamWriter,
+        outbox: asyncio.Queue[bytes | None],
+        *,
+        peer: Any,
+    ) -> None:
+        """
+        Write queued frames to a client until told to stop.
+
+        If a write fails the connection is closed, which ends the client's
+        read loop, and later frames are discarded so senders never block on
+        an outbox nobody writes out.
+
+        Every frame already queued when the task wakes is written in one
+        batch. The task only waits on the socket once the transport buffer
+        grows past the high-water mark; senders check the same mark.
+
+        Parameters
+        ----------
+        writer : asyncio.StreamWriter
+            Stream writer for the client connection.
+        outbox : asyncio.Queue[bytes | None]
+            Queue of encoded frames; None ends the loop.
+        peer : Any
+            Peer name reported by asyncio (typically (ip, port)).
+
+        Returns
+        -------
+        None
+        """
+        failed = False
+        while True:
+            frame = await outbox.get()
+            frames: list[bytes] = []
+            while frame is not None:
+                frames.append(frame)
+                if outbox.empty():
+                    break
+                frame = outbox.get_nowait()
+
+            if frames and not failed:
+                # One write of the joined batch; transport.writelines skips
+                # the lost-connection check on some Python versions.
+                writer.write(b"".join(frames))
+                if writer.transport.get_write_buffer_size() > _WRITE_HIGH_WATER:
+                    try:
+                        await writer.drain()
+                    except ConnectionError:
+                        self._log_info("Client write failed: %s", peer)
+                        failed = True
+                        writer.close()
+
+            if frame is None:
+                return
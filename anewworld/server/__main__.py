@@ -7,6 +7,8 @@ from __future__ import annotations
 import asyncio
 import logging
 import socket
+import sys
+from collections.abc import Callable
 
 from anewworld.server import GameServer
 
@@ -14,6 +16,28 @@ from .config import ServerConfig
 from .logging import setup_logging
 
 
+def _loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """
+    Select the event loop implementation for the server.
+
+    Returns
+    -------
+    Callable[[], asyncio.AbstractEventLoop] | None
+        uvloop's loop constructor if it is installed, otherwise None for
+        the default asyncio loop.
+    """
+    if sys.platform == "win32":
+        return None
+
+    try:
+        import uvloop
+    except ImportError:
+        return None
+
+    factory: Callable[[], asyncio.AbstractEventLoop] = uvloop.new_event_loop
+    return factory
+
+
 async def main() -> None:
     """
     Game server run.
@@ -39,4 +63,5 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    with asyncio.Runner(loop_factory=_loop_factory()) as runner:
+        runner.run(main())
@@ -93,6 +93,7 @@ class InventoryService:
     async def handle_request_inventory(
         self,
         writer: asyncio.StreamWriter,
+        msg: dict[str, Any],
         *,
         peer: Any,
         send: SendFn,
@@ -104,6 +105,8 @@ class InventoryService:
         ----------
         writer : asyncio.StreamWriter
             Stream writer associated with the client connection.
+        msg : dict[str, Any]
+            Message payload (unused).
         peer : Any
             Peer name reported by asyncio (typically (ip, port)).
         send : SendFn
@@ -14,28 +14,6 @@ from anewworld.server.sessions import Session, SessionRegistry, new_player_id
 logger = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True, slots=True)
-class PlayerContext:
-    """
-    Context for player-related request.
-    """
-
-    writer: asyncio.StreamWriter
-    """
-    Stream writer associated with the client connection.
-    """
-
-    peer: Any
-    """
-    Peer name reported by asyncio.
-    """
-
-    now_s: float
-    """
-    Current server timestamp (seconds).
-    """
-
-
 @dataclass(slots=True)
 class PlayerService:
     """
@@ -109,8 +87,10 @@ class PlayerService:
 
     async def handle_request_id(
         self,
-        ctx: PlayerContext,
+        writer: asyncio.StreamWriter,
         *,
+        peer: Any,
+        now_s: float,
         send: Any,
     ) -> int:
         """
@@ -118,8 +98,12 @@ class PlayerService:
 
         Parameters
         ----------
-        ctx : PlayerContext
-            Context for this request.
+        writer : asyncio.StreamWriter
+            Stream writer associated with the client connection.
+        peer : Any
+            Peer name reported by asyncio.
+        now_s : float
+            Current server timestamp (seconds).
         send: Any
             Async callable of the form: await send(writer, obj)
 
@@ -128,16 +112,16 @@ class PlayerService:
         int
             Player id assigned to this connection.
         """
-        existing_pid = self.sessions.by_writer.get(ctx.writer)
+        existing_pid = self.sessions.by_writer.get(writer)
         if existing_pid is not None:
             self._log_debug(
                 "Re-sent player_id=%d to %s (active=%d)",
                 existing_pid,
-                ctx.peer,
+                peer,
                 self.sessions.count(),
             )
             await send(
-                ctx.writer,
+                writer,
                 {
                     "t": "assign_id",
                     "player_id": existing_pid,
@@ -148,19 +132,19 @@ class PlayerService:
         player_id = new_player_id()
         session = Session(
             player_id=player_id,
-            writer=ctx.writer,
-            connected_at_s=ctx.now_s,
-            last_seen_s=ctx.now_s,
+            writer=writer,
+            connected_at_s=now_s,
+            last_seen_s=now_s,
         )
         self.sessions.add(session)
 
         self._log_info(
             "Assigned player_id=%d to %s (active=%d)",
             player_id,
-            ctx.peer,
+            peer,
             self.sessions.count(),
         )
-        await send(ctx.writer, {"t": "assign_id", "player_id": player_id})
+        await send(writer, {"t": "assign_id", "player_id": player_id})
         return player_id
 
     def get_player_id(self, writer: asyncio.StreamWriter) -> int | None:
@@ -97,9 +97,12 @@ class ChunkEdits:
     In-memory edit overlay for a single chunk.
     """
 
-    tiles: dict[tuple[int, int], PlacedObject] = field(default_factory=dict)
+    _tiles: dict[tuple[int, int], PlacedObject] = field(default_factory=dict)
     """
     Mapping from (lx, ly) to placed object.
+
+    Only changed through `set` and `remove`, so `_snapshot` never goes
+    stale.
     """
 
     last_access_s: float = 0.0
@@ -107,6 +110,91 @@ class ChunkEdits:
     Last time this chunk was accessed.
     """
 
+    _snapshot: list[dict[str, Any]] | None = None
+    """
+    Cached wire snapshot of `_tiles`, cleared whenever they change.
+    """
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        """
+        Get the wire snapshot of all placements in this chunk.
+
+        The list is built on first use after a change and shared until the
+        next change; callers must not mutate it.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            Placement records suitable for sending over the wire.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = [
+                placement.to_wire(lx=lx, ly=ly)
+                for (lx, ly), placement in self._tiles.items()
+            ]
+            self._snapshot = snapshot
+        return snapshot
+
+    def set(self, *, lx: int, ly: int, placement: PlacedObject) -> None:
+        """
+        Store a placement at a local tile.
+
+        Parameters
+        ----------
+        lx : int
+            Local x coordinate within chunk.
+        ly : int
+            Local y coordinate within chunk.
+        placement : PlacedObject
+            Placement record.
+
+        Returns
+        -------
+        None
+        """
+        self._tiles[(lx, ly)] = placement
+        self._snapshot = None
+
+    def occupied(self, *, lx: int, ly: int) -> bool:
+        """
+        Check whether a local tile holds a placement.
+
+        Parameters
+        ----------
+        lx : int
+            Local x coordinate within chunk.
+        ly : int
+            Local y coordinate within chunk.
+
+        Returns
+        -------
+        bool
+            True if the tile holds a placement, False otherwise.
+        """
+        return (lx, ly) in self._tiles
+
+    def remove(self, *, lx: int, ly: int) -> PlacedObject | None:
+        """
+        Remove the placement at a local tile, if any.
+
+        Parameters
+        ----------
+        lx : int
+            Local x coordinate within chunk.
+        ly : int
+            Local y coordinate within chunk.
+
+        Returns
+        -------
+        PlacedObject | None
+            Removed placement, or None if the tile was empty.
+        """
+        existing = self._tiles.pop((lx, ly), None)
+        if existing is not None:
+            self._snapshot = None
+        return existing
+
 
 class WorldEditsStore(Protocol):
     """
@@ -315,7 +403,7 @@ class WorldEditsRegistry:
 
         chunk = ChunkEdits()
         for lx, ly, placement in self.store.load_chunk(cx=cx, cy=cy):
-            chunk.tiles[(lx, ly)] = placement
+            chunk.set(lx=lx, ly=ly, placement=placement)
 
         self._touch(key, chunk)
         return chunk
@@ -335,12 +423,9 @@ class WorldEditsRegistry:
         -------
         list[dict[str, Any]]
             List of placement records suitable for sending over the wire.
+            Shared between calls until the chunk changes; do not mutate.
         """
-        chunk = self._get_or_load_chunk(cx=cx, cy=cy)
-        out: list[dict[str, Any]] = []
-        for (lx, ly), placement in chunk.tiles.items():
-            out.append(placement.to_wire(lx=lx, ly=ly))
-        return out
+        return self._get_or_load_chunk(cx=cx, cy=cy).snapshot()
 
     def can_place(self, *, wx: int, wy: int) -> bool:
         """
@@ -360,7 +445,7 @@ class WorldEditsRegistry:
         """
         cx, cy, lx, ly = _world_to_chunk(wx, wy, chunk_size=self.chunk_size)
         chunk = self._get_or_load_chunk(cx=cx, cy=cy)
-        return (lx, ly) not in chunk.tiles
+        return not chunk.occupied(lx=lx, ly=ly)
 
     def apply_place(
         self,
@@ -398,7 +483,7 @@ class WorldEditsRegistry:
         now = time.time()
         placement = PlacedObject(obj=obj, rot=rot, owner_id=player_id, updated_at_s=now)
 
-        chunk.tiles[(lx, ly)] = placement
+        chunk.set(lx=lx, ly=ly, placement=placement)
         self.store.upsert(cx=cx, cy=cy, lx=lx, ly=ly, placement=placement)
 
         return {
@@ -440,7 +525,7 @@ class WorldEditsRegistry:
         cx, cy, lx, ly = _world_to_chunk(wx, wy, chunk_size=self.chunk_size)
         chunk = self._get_or_load_chunk(cx=cx, cy=cy)
 
-        existing = chunk.tiles.pop((lx, ly), None)
+        existing = chunk.remove(lx=lx, ly=ly)
         if existing is not None:
             self.store.delete(cx=cx, cy=cy, lx=lx, ly=ly)
 
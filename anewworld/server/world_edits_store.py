@@ -9,7 +9,7 @@ import threading
 from collections.abc import Iterable
 from dataclasses import dataclass
 
-from anewworld.shared.resource import Resource
+from anewworld.shared.resource import RESOURCE_BY_VALUE
 
 from .world_edits_registry import PlacedObject
 
@@ -115,6 +115,11 @@ class WorldEditsStore:
         -------
         Iterable[tuple[int, int, PlacedObject]]
             Iterable of (lx, ly, placement) records.
+
+        Raises
+        ------
+        ValueError
+            If a stored placement has an unknown object value.
         """
         with self._lock:
             cur = self._conn.execute(
@@ -129,14 +134,23 @@ class WorldEditsStore:
 
         out: list[tuple[int, int, PlacedObject]] = []
 
+        # Column affinities already give int / float / None values.
         for lx, ly, obj, rot, owner_id, updated_at_s in rows:
+            resource = RESOURCE_BY_VALUE.get(obj)
+            if resource is None:
+                # Skipping the row would let the next placement overwrite it.
+                raise ValueError(
+                    f"Unknown placement obj {obj!r} at chunk ({cx}, {cy}) "
+                    f"tile ({lx}, {ly})."
+                )
+
             placement = PlacedObject(
-                obj=Resource(obj),
-                rot=int(rot),
-                owner_id=int(owner_id) if owner_id is not None else None,
-                updated_at_s=float(updated_at_s),
+                obj=resource,
+                rot=rot,
+                owner_id=owner_id,
+                updated_at_s=updated_at_s,
             )
-            out.append((int(lx), int(ly), placement))
+            out.append((lx, ly, placement))
 
         return out
 
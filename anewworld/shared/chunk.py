@@ -6,8 +6,16 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import numpy as np
+import numpy.typing as npt
+
 from .tile_type import TileType
 
+_TILE_TYPES: dict[int, TileType] = {int(t): t for t in TileType}
+"""
+Lookup from raw tile value to TileType member.
+"""
+
 
 @dataclass(slots=True)
 class Chunk:
@@ -20,29 +28,11 @@ class Chunk:
     Width and height of chunk in tiles.
     """
 
-    terrain: list[TileType]
+    terrain: npt.NDArray[np.uint8]
     """
-    Flat list of terrain values in row-major order.
+    TileType values indexed as [y, x].
     """
 
-    def _idx(self, x: int, y: int) -> int:
-        """
-        Convert local (x, y) coords into flat list idx.
-
-        Parameters
-        ----------
-        x : int
-            x-coordinate
-        y : int
-            y-coordinate
-
-        Returns
-        -------
-        int
-            Index into flat terrain list
-        """
-        return y * self.size + x
-
     def terrain_at(self, x: int, y: int) -> TileType:
         """
         Retrieve terrain at chunk coord.
@@ -59,4 +49,4 @@ class Chunk:
         TileType
             Terrain at (x, y)
         """
-        return self.terrain[self._idx(x, y)]
+        return _TILE_TYPES[int(self.terrain[y, x])]
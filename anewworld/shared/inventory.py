@@ -6,7 +6,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
-from .resource import Resource
+from .resource import RESOURCE_BY_VALUE, RESOURCE_INDEX, Resource
 
 
 @dataclass(slots=True)
@@ -15,9 +15,9 @@ class Inventory:
     Server authoritative inventory of resources.
     """
 
-    amounts: dict[Resource, int] = field(default_factory=dict)
+    counts: list[int] = field(default_factory=lambda: [0] * len(RESOURCE_INDEX))
     """
-    Mapping of resource type to non-negative quantity.
+    Non-negative quantity of each resource, indexed by `RESOURCE_INDEX`.
     """
 
     @classmethod
@@ -30,7 +30,9 @@ class Inventory:
         Inventory
             Starter inventory with initial resources.
         """
-        return cls(amounts={Resource.HOUSE: 1})
+        inv = cls()
+        inv.add(Resource.HOUSE, 1)
+        return inv
 
     def to_wire(self) -> dict[str, int]:
         """
@@ -41,7 +43,8 @@ class Inventory:
         dict[str, int]
             Mapping of resource key strings to quantities.
         """
-        return {rt.value: qty for rt, qty in self.amounts.items()}
+        counts = self.counts
+        return {rt.value: counts[i] for rt, i in RESOURCE_INDEX.items() if counts[i]}
 
     @classmethod
     def from_wire(cls, obj: dict[str, int]) -> Inventory:
@@ -58,15 +61,14 @@ class Inventory:
         Inventory
             Parsed inventory instance.
         """
-        amounts: dict[Resource, int] = {}
+        by_value = RESOURCE_BY_VALUE
+        inv = cls()
+        counts = inv.counts
         for k, v in obj.items():
-            try:
-                rt = Resource(k)
-            except ValueError:
-                continue
-            if isinstance(v, int) and v >= 0:
-                amounts[rt] = v
-        return cls(amounts=amounts)
+            rt = by_value.get(k)
+            if rt is not None and isinstance(v, int) and v >= 0:
+                counts[RESOURCE_INDEX[rt]] = v
+        return inv
 
     def get(self, resource: Resource) -> int:
         """
@@ -82,7 +84,7 @@ class Inventory:
         int
             Quantity owned (0 if absent).
         """
-        return self.amounts.get(resource, 0)
+        return self.counts[RESOURCE_INDEX[resource]]
 
     def has(self, resource: Resource, qty: int = 1) -> bool:
         """
@@ -121,7 +123,7 @@ class Inventory:
         """
         if qty <= 0:
             return
-        self.amounts[resource] = self.get(resource) + qty
+        self.counts[RESOURCE_INDEX[resource]] += qty
 
     def try_remove(self, resource: Resource, qty: int) -> bool:
         """
@@ -142,14 +144,10 @@ class Inventory:
         if qty <= 0:
             return True
 
-        current = self.get(resource)
-        if current < qty:
+        counts = self.counts
+        idx = RESOURCE_INDEX[resource]
+        if counts[idx] < qty:
             return False
 
-        new_amount = current - qty
-        if new_amount == 0:
-            self.amounts.pop(resource, None)
-        else:
-            self.amounts[resource] = new_amount
-
+        counts[idx] -= qty
         return True
@@ -4,10 +4,14 @@ N-dimensional LUT for level combinations.
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+import itertools
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 from typing import Generic, TypeVar
 
+import numpy as np
+import numpy.typing as npt
+
 K = TypeVar("K")
 V = TypeVar("V")
 
@@ -43,3 +47,23 @@ class LevelGrid(Generic[K, V]):
             Mapped output if present, default otherwise.
         """
         return self.table.get(tuple(keys), self.default)
+
+    def to_array(self, *axes: Sequence[K]) -> npt.NDArray[np.uint8]:
+        """
+        Materialize the LUT as a dense array over the given levels.
+
+        Outputs must be integers in [0, 255], such as TileType members.
+
+        Parameters
+        ----------
+        *axes : Sequence[K]
+            Levels for each key position, in key order.
+
+        Returns
+        -------
+        npt.NDArray[np.uint8]
+            Array where `arr[i, j, ...]` is `get(axes[0][i], axes[1][j], ...)`.
+        """
+        shape = tuple(len(axis) for axis in axes)
+        flat = [self.get(*keys) for keys in itertools.product(*axes)]
+        return np.array(flat, dtype=np.uint8).reshape(shape)
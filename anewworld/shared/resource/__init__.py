@@ -17,3 +17,19 @@ class Resource(StrEnum):
 
     # TODO: Make resources more complex
     # Use something like ResourceType (placeable/spendable)
+
+
+RESOURCE_BY_VALUE: dict[str, Resource] = {rt.value: rt for rt in Resource}
+"""
+Lookup from wire/storage value to Resource.
+
+Cheaper than calling `Resource(value)`, and returns None via `.get` for
+unknown values instead of raising.
+"""
+
+RESOURCE_INDEX: dict[Resource, int] = {
+    rt: i for i, rt in enumerate(Resource.__members__.values())
+}
+"""
+Dense index of each Resource, used to address per-resource count lists.
+"""
@@ -7,7 +7,8 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Generic
 
-from noise import pnoise2
+import numpy as np
+import numpy.typing as npt
 
 from .level import LevelT
 from .level.elevation import ElevationLevel
@@ -15,6 +16,116 @@ from .level.level_grid import LevelGrid
 from .level.moisture import MoistureLevel
 from .tile_type import TileType
 
+_PERM = np.frombuffer(
+    bytes.fromhex(
+        "97a0895b5a0f830dc95f6035c2e907e18c24671e458e086325f0150a17be0694"
+        "f778ea4b001ac53e5efcdbcb75230b2039b12158ed953857ae147d88aba844af"
+        "4aa547868b301ba64d929ee7536fe57a3cd385e6dc695c29372ef528f4668f36"
+        "41193fa101d85049d14c84bbd05912a9c8c4878274bc9f56a4646dc6adba0340"
+        "34d9e2fa7c7b05ca2693767eff5255d4cfce3be32f103a11b6bd1c2adfb7aad5"
+        "77f898022c9aa346dd99659ba72bac09811627fd13626c6e4f71e0e8b2b97068"
+        "daf661e4fb22f2c1eed2900cbfb3a2f1513391ebf90eef6b31c0d61fb5c76a9d"
+        "b854ccb07379322d7f0496fe8aeccd5dde72431d1848f38d80c34e42d73d9cb4"
+    ),
+    dtype=np.uint8,
+).astype(np.intp)
+"""
+Ken Perlin's reference permutation, the table `noise.pnoise2` hashes with.
+"""
+
+_GRAD_X = np.array(
+    [1, -1, 1, -1, 1, -1, 1, -1, 0, 0, 0, 0, 1, -1, 0, 0], dtype=np.float32
+)
+"""
+X components of the perlin gradient vectors, indexed by hash & 15.
+"""
+
+_GRAD_Y = np.array(
+    [1, 1, -1, -1, 0, 0, 0, 0, 1, -1, 1, -1, 0, 0, -1, 1], dtype=np.float32
+)
+"""
+Y components of the perlin gradient vectors, indexed by hash & 15.
+"""
+
+
+def _fade(t: npt.NDArray[np.float32]) -> npt.NDArray[np.float32]:
+    """
+    Apply the perlin smoothstep curve 6t^5 - 15t^4 + 10t^3.
+
+    Parameters
+    ----------
+    t : npt.NDArray[np.float32]
+        Fractional lattice offsets in [0, 1).
+
+    Returns
+    -------
+    npt.NDArray[np.float32]
+        Interpolation weights.
+    """
+    w = t * t * t * (t * (t * 6.0 - 15.0) + 10.0)
+    return w.astype(np.float32, copy=False)
+
+
+def _perlin2(
+    xs: npt.NDArray[np.float32],
+    ys: npt.NDArray[np.float32],
+    perm: npt.NDArray[np.intp],
+    grad_x: npt.NDArray[np.float32],
+    grad_y: npt.NDArray[np.float32],
+) -> npt.NDArray[np.float32]:
+    """
+    Evaluate one octave of 2D perlin noise over a grid.
+
+    Matches `noise.pnoise2` bit for bit, including its single precision
+    arithmetic. Lattice cells, offsets and fade weights are computed per
+    axis and then broadcast, so only the corner hashes and dot products
+    are 2D.
+
+    Parameters
+    ----------
+    xs : npt.NDArray[np.float32]
+        Noise-space x-coordinates, one per column.
+    ys : npt.NDArray[np.float32]
+        Noise-space y-coordinates, one per row.
+    perm : npt.NDArray[np.intp]
+        Base-shifted permutation table of length 512.
+    grad_x : npt.NDArray[np.float32]
+        Gradient x component for each hash in [0, 256).
+    grad_y : npt.NDArray[np.float32]
+        Gradient y component for each hash in [0, 256).
+
+    Returns
+    -------
+    npt.NDArray[np.float32]
+        Noise of shape (len(ys), len(xs)).
+    """
+    x0 = np.floor(xs)
+    y0 = np.floor(ys)
+    fx = xs - x0
+    fy = (ys - y0)[:, None]
+    xi = x0.astype(np.intp) & 255
+    yi = (y0.astype(np.intp) & 255)[:, None]
+
+    u = _fade(fx)
+    v = _fade(fy)
+
+    a = perm[xi]
+    b = perm[(xi + 1) & 255]
+    aa = perm[a + yi]
+    ab = perm[a + ((yi + 1) & 255)]
+    ba = perm[b + yi]
+    bb = perm[b + ((yi + 1) & 255)]
+
+    n00 = grad_x[aa] * fx + grad_y[aa] * fy
+    n10 = grad_x[ba] * (fx - 1.0) + grad_y[ba] * fy
+    n01 = grad_x[ab] * fx + grad_y[ab] * (fy - 1.0)
+    n11 = grad_x[bb] * (fx - 1.0) + grad_y[bb] * (fy - 1.0)
+
+    nx0 = n00 + u * (n10 - n00)
+    nx1 = n01 + u * (n11 - n01)
+    out: npt.NDArray[np.float32] = nx0 + v * (nx1 - nx0)
+    return out
+
 
 @dataclass(frozen=True, slots=True)
 class _TerrainParameter(Generic[LevelT]):
@@ -24,7 +135,7 @@ class _TerrainParameter(Generic[LevelT]):
 
     seed: int
     """
-    World seed.
+    Noise base, the `base` argument of `noise.pnoise2`.
     """
 
     scale: float
@@ -66,68 +177,160 @@ class _TerrainParameter(Generic[LevelT]):
     Entries of form (threshold, level).
     """
 
-    def sample(self, *, x: float, y: float) -> float:
+    perm: npt.NDArray[np.intp] = field(init=False, repr=False, compare=False)
+    """
+    Reference permutation shifted by the base, repeated once so corner
+    hashes never wrap.
+    """
+
+    grad_x: npt.NDArray[np.float32] = field(init=False, repr=False, compare=False)
+    """
+    Gradient x component selected by each corner hash.
+    """
+
+    grad_y: npt.NDArray[np.float32] = field(init=False, repr=False, compare=False)
+    """
+    Gradient y component selected by each corner hash.
+    """
+
+    thresholds: npt.NDArray[np.int64] = field(init=False, repr=False, compare=False)
+    """
+    Cutoff thresholds in ascending order, used to bucket quantized values.
+    """
+
+    def __post_init__(self) -> None:
+        """
+        Build permutation, gradient and threshold tables.
+        """
+        # pnoise2 adds the base to every lattice index before hashing. Its
+        # table only has 512 entries, so any base above 1 reads past the end;
+        # wrapping at the table's period of 256 gives the same result
+        # whenever pnoise2 stays in bounds, and a defined one otherwise.
+        perm = np.roll(_PERM, -(self.seed & 255))
+        object.__setattr__(self, "perm", np.concatenate((perm, perm)))
+        # Resolve the final hash lookup to gradients once, so each corner
+        # skips the permutation gather and the & 15 mask.
+        object.__setattr__(self, "grad_x", _GRAD_X[_PERM & 15])
+        object.__setattr__(self, "grad_y", _GRAD_Y[_PERM & 15])
+        object.__setattr__(
+            self,
+            "thresholds",
+            np.floor([thr for thr, _ in self.cutoffs]).astype(np.int64),
+        )
+
+    @property
+    def levels(self) -> tuple[LevelT, ...]:
         """
-        Sample raw perlin noise at (x, y).
+        Levels in cutoff order.
+
+        Returns
+        -------
+        tuple[LevelT, ...]
+            Level for each cutoff, indexed like `thresholds`.
+        """
+        return tuple(lvl for _, lvl in self.cutoffs)
+
+    def sample(
+        self,
+        *,
+        xs: npt.NDArray[np.float64],
+        ys: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float32]:
+        """
+        Sample fractal perlin noise over a grid of world coordinates.
 
         Parameters
         ----------
-        x : float
-            World x-coordinate in tiles
-        y : float
-            World y-coordinate in tiles
+        xs : npt.NDArray[np.float64]
+            World x-coordinates in tiles, one per column.
+        ys : npt.NDArray[np.float64]
+            World y-coordinates in tiles, one per row.
+
+        Returns
+        -------
+        npt.NDArray[np.float32]
+            Noise of shape (len(ys), len(xs)), roughly in [-1, 1].
         """
+        # Same precision and operation order as pnoise2, which takes its
+        # arguments as C floats and accumulates octaves in single precision.
         inv_scale = 1.0 / self.scale
-        sample: float = pnoise2(
-            x * inv_scale,
-            y * inv_scale,
-            octaves=self.octaves,
-            persistence=self.persistence,
-            lacunarity=self.lacunarity,
-            base=self.seed,
-        )
-        return sample
+        nx = (xs * inv_scale).astype(np.float32)
+        ny = (ys * inv_scale).astype(np.float32)
+        lacunarity = np.float32(self.lacunarity)
+        persistence = np.float32(self.persistence)
+
+        total = np.zeros((ys.size, xs.size), dtype=np.float32)
+        freq = np.float32(1.0)
+        amp = np.float32(1.0)
+        max_amp = np.float32(0.0)
+
+        for _ in range(self.octaves):
+            total += (
+                _perlin2(nx * freq, ny * freq, self.perm, self.grad_x, self.grad_y)
+                * amp
+            )
+            max_amp += amp
+            freq *= lacunarity
+            amp *= persistence
+
+        out: npt.NDArray[np.float32] = total / max_amp
+        return out
 
-    def sample_q(self, *, x: float, y: float) -> int:
+    def sample_q(
+        self,
+        *,
+        xs: npt.NDArray[np.float64],
+        ys: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.int64]:
         """
-        Sample and quantize perlin noise at (x, y).
+        Sample and quantize perlin noise over a grid of world coordinates.
 
         Parameters
         ----------
-        x : float
-            World x-coordinate in tiles.
-        y : float
-            World y-coordinate in tiles.
+        xs : npt.NDArray[np.float64]
+            World x-coordinates in tiles, one per column.
+        ys : npt.NDArray[np.float64]
+            World y-coordinates in tiles, one per row.
 
         Returns
         -------
-        int
-            Quantized noise value.
+        npt.NDArray[np.int64]
+            Quantized noise values.
         """
-        v = self.sample(x=x, y=y)
-        return int((v + self.bias) * self.amplitude)
-
-    def level_at(self, *, x: float, y: float) -> LevelT:
+        v = self.sample(xs=xs, ys=ys).astype(np.float64)
+        return np.trunc((v + self.bias) * self.amplitude).astype(np.int64)
+
+    def level_idx(
+        self,
+        *,
+        xs: npt.NDArray[np.float64],
+        ys: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.intp]:
         """
-        Sample and classify into a level using cutoffs.
+        Sample and classify into level indices using cutoffs.
 
         Parameters
         ----------
-        x : float
-            World x-coordinate in tiles.
-        y : float
-            World y-coordinate in tiles.
+        xs : npt.NDArray[np.float64]
+            World x-coordinates in tiles, one per column.
+        ys : npt.NDArray[np.float64]
+            World y-coordinates in tiles, one per row.
 
         Returns
         -------
-        LevelT
-            Classified level.
+        npt.NDArray[np.intp]
+            Index into `levels` for every sampled point.
+
+        Raises
+        ------
+        ValueError
+            If a quantized value falls above the last cutoff.
         """
-        q = self.sample_q(x=x, y=y)
-        for thr, lvl in self.cutoffs:
-            if q <= thr:
-                return lvl
-        raise ValueError("Cutoffs do not cover quantized range.")
+        q = self.sample_q(xs=xs, ys=ys)
+        idx = np.searchsorted(self.thresholds, q, side="left")
+        if idx.max() >= len(self.cutoffs):
+            raise ValueError("Cutoffs do not cover quantized range.")
+        return idx
 
 
 @dataclass(frozen=True, slots=True)
@@ -156,9 +359,14 @@ class TerrainGenerator:
     Moisture noise parameter.
     """
 
+    _lut: npt.NDArray[np.uint8] = field(init=False, repr=False, compare=False)
+    """
+    TileType values indexed by [elevation level, moisture level].
+    """
+
     def __post_init__(self) -> None:
         """
-        Instantiate _TerrainParameter objects.
+        Instantiate _TerrainParameter objects and the tile lookup table.
         """
         object.__setattr__(
             self,
@@ -196,7 +404,14 @@ class TerrainGenerator:
             ),
         )
 
-    def generate_chunk(self, *, cx: int, cy: int, chunk_size: int) -> list[TileType]:
+        elev_levels = self.elevation.levels
+        lut = self.land_grid.to_array(elev_levels, self.moisture.levels)
+        lut[elev_levels.index(ElevationLevel.LOW), :] = TileType.DEFAULT_WATER
+        object.__setattr__(self, "_lut", lut)
+
+    def generate_chunk(
+        self, *, cx: int, cy: int, chunk_size: int
+    ) -> npt.NDArray[np.uint8]:
         """
         Generate terrain for a single chunk.
 
@@ -211,29 +426,15 @@ class TerrainGenerator:
 
         Returns
         -------
-        list[TileType]
-            Flat row-major buffer of TileType values.
+        npt.NDArray[np.uint8]
+            Array of TileType values indexed as [y, x].
         """
-        wx0 = cx * chunk_size
-        wy0 = cy * chunk_size
+        offsets = np.arange(chunk_size, dtype=np.float64)
+        xs = cx * chunk_size + offsets
+        ys = cy * chunk_size + offsets
 
-        out: list[TileType] = [TileType.DEFAULT_GRASS] * (chunk_size**2)
+        elev = self.elevation.level_idx(xs=xs, ys=ys)
+        moist = self.moisture.level_idx(xs=xs, ys=ys)
 
-        xs = [float(wx0 + lx) for lx in range(chunk_size)]
-
-        for ly in range(chunk_size):
-            y = float(wy0 + ly)
-            row_off = ly * chunk_size
-
-            for lx, x in enumerate(xs):
-                elev = self.elevation.level_at(x=x, y=y)
-
-                if elev is ElevationLevel.LOW:
-                    out[row_off + lx] = TileType.DEFAULT_WATER
-                    continue
-
-                moist = self.moisture.level_at(x=x, y=y)
-
-                out[row_off + lx] = self.land_grid.get(elev, moist)
-
-        return out
+        tiles: npt.NDArray[np.uint8] = self._lut[elev, moist]
+        return tiles
@@ -5,7 +5,7 @@ Generic least-recently-used (LRU) cache implementation.
 from __future__ import annotations
 
 from collections import OrderedDict
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from typing import Generic, TypeVar
 
@@ -98,6 +98,41 @@ class LRUCache(Generic[K, V]):
         self._data[key] = value
         return value
 
+    def peek(self, key: K, default: V | None = None) -> V | None:
+        """
+        Retrieve a value from the cache without changing its recency.
+
+        Parameters
+        ----------
+        key : K
+            Cache key.
+        default : Optional[V]
+            Value to return if the key is not present.
+
+        Returns
+        -------
+        Optional[V]
+            Cached value if present, otherwise the default.
+        """
+        return self._data.get(key, default)
+
+    def touch_many(self, keys: Iterable[K]) -> None:
+        """
+        Mark several entries as most recently used, in iteration order.
+
+        Keys that are not present are ignored.
+
+        Parameters
+        ----------
+        keys : Iterable[K]
+            Cache keys to refresh.
+        """
+        data = self._data
+        move_to_end = data.move_to_end
+        for key in keys:
+            if key in data:
+                move_to_end(key)
+
     def put(self, key: K, value: V) -> None:
         """
         Insert or update a cache entry and mark it as most recently used.
@@ -4,7 +4,11 @@ Entire map of game.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass, field
+
+import numpy as np
+import numpy.typing as npt
 
 from .chunk import Chunk
 from .terrain_generator import TerrainGenerator
@@ -38,6 +42,13 @@ class WorldMap:
     Mapping from chunk coords (cx, cy) to generated chunks.
     """
 
+    _pending: dict[tuple[int, int], Future[npt.NDArray[np.uint8]]] = field(
+        default_factory=dict
+    )
+    """
+    In-flight background generation jobs keyed by chunk coords.
+    """
+
     @classmethod
     def new(
         cls,
@@ -119,11 +130,15 @@ class WorldMap:
         if chunk is not None:
             return chunk
 
-        terrain = self.generator.generate_chunk(
-            cx=cx,
-            cy=cy,
-            chunk_size=self.chunk_size,
-        )
+        pending = self._pending.pop(key, None)
+        if pending is not None:
+            terrain = pending.result()
+        else:
+            terrain = self.generator.generate_chunk(
+                cx=cx,
+                cy=cy,
+                chunk_size=self.chunk_size,
+            )
 
         chunk = Chunk(size=self.chunk_size, terrain=terrain)
         self._chunks.put(key, chunk)
@@ -147,6 +162,68 @@ class WorldMap:
         """
         return self._get_chunk(cx, cy)
 
+    def is_ready(self, cx: int, cy: int) -> bool:
+        """
+        Check whether a chunk can be returned without generating it.
+
+        Parameters
+        ----------
+        cx : int
+            Chunk X coordinate.
+        cy : int
+            Chunk Y coordinate.
+
+        Returns
+        -------
+        bool
+            True if the chunk is cached or its background job has finished.
+        """
+        key = (cx, cy)
+        if key in self._chunks:
+            return True
+
+        pending = self._pending.get(key)
+        return pending is not None and pending.done()
+
+    def prefetch(self, cx: int, cy: int, executor: Executor) -> None:
+        """
+        Start generating a chunk in the background if it is not available.
+
+        The result is picked up by `collect_prefetched` or, if the chunk is
+        requested first, by `chunk_at`.
+
+        Parameters
+        ----------
+        cx : int
+            Chunk X coordinate.
+        cy : int
+            Chunk Y coordinate.
+        executor : Executor
+            Executor used to run the generator.
+        """
+        key = (cx, cy)
+        if key in self._chunks or key in self._pending:
+            return
+
+        self._pending[key] = executor.submit(
+            self.generator.generate_chunk,
+            cx=cx,
+            cy=cy,
+            chunk_size=self.chunk_size,
+        )
+
+    def collect_prefetched(self) -> None:
+        """
+        Move finished background chunks into the chunk cache.
+
+        Must be called from the thread that owns the world map.
+        """
+        done = [key for key, fut in self._pending.items() if fut.done()]
+        for key in done:
+            terrain = self._pending.pop(key).result()
+            if key not in self._chunks:
+                self._chunks.put(key, Chunk(size=self.chunk_size, terrain=terrain))
+
     def terrain_at(self, x: int, y: int) -> TileType:
         """
         Retrieve the terrain type at world coordinates.